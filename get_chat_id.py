@@ -7,7 +7,8 @@ bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
 
 print('📋 Getting chat updates to find your correct chat ID...')
 url = f'https://api.telegram.org/bot{bot_token}/getUpdates'
-response = requests.get(url, timeout=10)
+session = requests.Session()  # One connection for the lookup and the test send
+response = session.get(url, timeout=10)
 
 if response.status_code == 200:
     data = response.json()
@@ -30,7 +31,7 @@ if response.status_code == 200:
                 # Test sending a message with the correct chat ID
                 print('\n🧪 Testing message send with correct chat ID...')
                 send_url = f'https://api.telegram.org/bot{bot_token}/sendMessage'
-                test_response = requests.post(send_url, json={
+                test_response = session.post(send_url, json={
                     'chat_id': correct_chat_id,
                     'text': '🎉 Success! Your Badminton Checker is working!'
                 }, timeout=10)
@@ -48,3 +49,5 @@ if response.status_code == 200:
         print('4. Run this script again')
 else:
     print(f'Error getting updates: {response.text}')
+
+session.close()
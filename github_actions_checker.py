@@ -5,24 +5,39 @@ Simplified version that works with GitHub Actions automation
 """
 
 import asyncio
+import functools
 import os
 import sys
 import json
 import logging
-import requests
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from urllib.parse import urlsplit
 
 # Import helper functions
 from src.checker_helpers import (
     load_env_file, 
     send_telegram_message, 
+    send_telegram_message_async,
+    get_telegram_session,
+    close_telegram_session,
     get_check_dates, 
-    format_results_message
+    load_settings,
+    read_seen_slots,
+    diff_new_slots,
+    commit_seen_slots,
+    seen_slot_key,
+    court_number,
+    normalize_slot_time,
+    format_results_message,
+    read_json,
+    loads_json,
+    age_seconds,
+    format_date,
+    write_json,
+    install_uvloop
 )
 
 # Load .env file on import
@@ -40,12 +55,15 @@ logger = logging.getLogger(__name__)
 
 try:
     from playwright.async_api import async_playwright
+    from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     logger.error("❌ Playwright not available")
     PLAYWRIGHT_AVAILABLE = False
     sys.exit(1)
 
+from src.browser_pool import get_playwright, new_context, close_browser_pool
+
 # Import API checker for hybrid approach
 try:
     from src.api_checker import HybridBookingChecker, BadmintonAPIChecker
@@ -55,21 +73,335 @@ except ImportError as e:
     logger.warning(f"⚠️ API checker not available: {e}")
     API_CHECKER_AVAILABLE = False
 
+# Chromium flags for the headless checker run
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--no-sandbox',               # Runners are throwaway containers
+    '--disable-dev-shm-usage',    # /dev/shm is tiny on CI runners
+    '--disable-gpu',              # No GPU process in headless mode
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--no-first-run',
+    '--disable-features=site-per-process',  # Fewer renderer processes
+]
+
+# Resource types the slot checker never needs - the court/slot data comes
+# from the document, scripts and XHR/fetch calls. Stylesheets are kept
+# because login modal visibility checks depend on them.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+# Third-party trackers loaded by the booking site, aborted whatever their type
+BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'connect.facebook.net',
+)
+
+# Saved sessions older than this need a fresh login (matches artifact retention)
+SESSION_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+# Dates of one academy are checked on this many tabs at once
+MAX_PARALLEL_PAGES = 3
+
+# Booking page elements
+DATE_INPUT_SELECTOR = 'input#card1[type="date"]'
+COURT_SELECTOR = 'div.court-item'
+SLOT_SELECTOR = 'span.styled-btn'
+
+# Page predicates for condition-based waits instead of fixed sleeps
+COURTS_RENDERED_JS = "() => document.querySelectorAll('%s').length > 0" % COURT_SELECTOR
+# Text and state of every slot, to tell one court's slot list from another's
+SLOT_SIGNATURE_JS = """() => [...document.querySelectorAll('%s')]
+    .map(e => e.innerText + '|' + (e.getAttribute('style') || '')).join('\\n')""" % SLOT_SELECTOR
+# The slot list no longer matches the signature taken before a court click
+SLOTS_CHANGED_JS = """previous => [...document.querySelectorAll('%s')]
+    .map(e => e.innerText + '|' + (e.getAttribute('style') || '')).join('\\n') !== previous""" % SLOT_SELECTOR
+# Resolves once the page has painted twice, i.e. React committed what it
+# rendered from a response that just arrived. Hidden tabs (e.g. background
+# tabs of a CDP Chrome) pause requestAnimationFrame, so a timer caps the wait.
+NEXT_PAINT_JS = """() => Promise.race([
+    new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r))),
+    new Promise(r => setTimeout(r, 100))
+])"""
+COURT_COUNT_JS = "n => document.querySelectorAll('%s').length === n" % COURT_SELECTOR
+
+# Read every court name / time slot in one round-trip. JSON.stringify in the
+# page plus loads_json here is cheaper than Playwright's value serializer.
+COURT_NAMES_JS = """() => JSON.stringify(
+    [...document.querySelectorAll('%s')].map(e => e.innerText)
+)""" % COURT_SELECTOR
+# The page-side part of save_session (storage, user agent, URL) in one
+# round-trip; cookies and storage_state come from the context separately
+SESSION_SNAPSHOT_JS = """() => JSON.stringify({
+    ls: Object.assign({}, localStorage),
+    ss: Object.assign({}, sessionStorage),
+    ua: navigator.userAgent,
+    url: location.href
+})"""
+# Logged-in UI: a visible logout button and/or user profile menu, else null
+LOGGED_IN_UI_JS = """() => {
+    const visible = e => !!e && !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+    const logout = [...document.querySelectorAll('[data-testid="logout-button"], .logout-btn')].some(visible) ||
+        [...document.querySelectorAll('button')].some(b => visible(b) && /log ?out/i.test(b.innerText));
+    const profile = [...document.querySelectorAll('.user-profile, .user-menu, [data-testid="user-menu"]')].some(visible);
+    return (logout || profile) ? {logout, profile} : null;
+}"""
+
+# Any of these means the SPA has rendered past its loading shell: the login
+# button when logged out, the user menu when logged in, or the date picker
+APP_READY_SELECTOR = ', '.join((
+    '.login-btn',
+    '[class*="login-btn"]',
+    '.logout-btn',
+    '.user-profile',
+    '.user-menu',
+    '[data-testid="user-menu"]',
+    DATE_INPUT_SELECTOR,
+))
+
+# Triage a selector list in one round-trip: 1 = a visible match, 0 = no
+# visible match, null = not plain CSS (Playwright-only :has-text, text=, ...)
+SELECTOR_VISIBILITY_JS = """sels => {
+    const visible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+    return sels.map(s => {
+        try {
+            return [...document.querySelectorAll(s)].some(visible) ? 1 : 0;
+        } catch (err) {
+            return null;
+        }
+    });
+}"""
+
+# Booking page elements and stored auth data checked by verify_login, in one
+# round-trip instead of one per element and one per storage key
+PAGE_LOGIN_STATE_JS = """() => {
+    const anyKey = keys => keys.some(k => !!localStorage.getItem(k));
+    return {
+        date: !!document.querySelector('%s'),
+        courts: document.querySelectorAll('%s').length,
+        token: anyKey(['authToken', 'auth_token', 'token', 'user_token']),
+        user: anyKey(['user', 'userData', 'currentUser'])
+    };
+}""" % (DATE_INPUT_SELECTOR, COURT_SELECTOR)
+
+# The site stores its auth token once the OTP login went through
+LOGIN_TOKEN_SET_JS = "() => !!localStorage.getItem('loginToken')"
+
+# Attributes logged when inspecting login form inputs
+INPUT_ATTRIBUTES_JS = """e => ({
+    id: e.getAttribute('id'),
+    name: e.getAttribute('name'),
+    type: e.getAttribute('type'),
+    placeholder: e.getAttribute('placeholder'),
+    maxlength: e.getAttribute('maxlength'),
+    class: e.getAttribute('class')
+})"""
+
+# Profile endpoint the site itself calls with the loginToken header
+BOOKING_API_BASE = 'https://adminbooking.gopichandacademy.com/API/'
+PROFILE_API_URL = BOOKING_API_BASE + 'Customer/Data/Get/Profile'
+
+# Init script restoring saved storage on the saved origin: (origin, ls, ss)
+STORAGE_RESTORE_JS = """(() => {
+    if (location.origin !== %s) return;
+    const seed = (storage, items) => {
+        try {
+            for (const [k, v] of Object.entries(items)) {
+                if (storage.getItem(k) === null) storage.setItem(k, v);
+            }
+        } catch (e) {}
+    };
+    seed(localStorage, %s);
+    seed(sessionStorage, %s);
+})();"""
+
+# Booked slots are rendered red with a not-allowed cursor. The patterns are
+# compiled once per call and tolerate any spacing/case in the inline style.
+TIME_SLOTS_JS = r"""() => {
+    const red = /color:\s*red/i;
+    const notAllowed = /cursor:\s*not-allowed/i;
+    return JSON.stringify(
+        [...document.querySelectorAll('%s')].map(e => {
+            const s = e.getAttribute('style') || '';
+            return {t: e.innerText, b: red.test(s) && notAllowed.test(s)};
+        })
+    );
+}""" % SLOT_SELECTOR
+
+
+@functools.lru_cache(maxsize=None)
+def selector_group(selectors):
+    """Join a selector tuple into one grouped selector (built once per tuple)"""
+    return ', '.join(selectors)
+
+
+async def block_heavy_resources(route):
+    """Abort requests for resources and trackers that are not needed to read slots"""
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(host in request.url for host in BLOCKED_HOSTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
 class GitHubActionsChecker:
     """Simplified checker for GitHub Actions"""
     
+    # Login flow selectors, most specific first.
+    # Based on the HTML: <input type="text" id="mobile" maxlength="10"
+    # placeholder="Enter Your Mobile Number"> inside the login modal
+    PHONE_SELECTOR = ', '.join((
+        '.modal-overlay input[id="mobile"]',
+        '.modal-overlay input[placeholder*="Mobile Number" i]',
+        '.modal-overlay input[maxlength="10"]',
+        '.modal-content input[id="mobile"]',
+        '.contact-form input[id="mobile"]',
+        'input[id="mobile"]',
+    ))
+    
+    # The "Login / SignUp" button that opens the modal
+    LOGIN_BUTTON_SELECTORS = (
+        '.login-btn',
+        '[class*="login-btn"]',
+        'div:has-text("Login / ")',
+        'div:has-text("SignUp")',
+        'span:has-text("Login /")',
+    )
+    
+    # Send OTP button has class="custom-button" and value="Send OTP"
+    SEND_OTP_SELECTORS = (
+        '.modal-overlay .custom-button',  # The class that actually exists (from debug)
+        '.modal-overlay input[type="submit"]',  # Generic submit button in modal
+        '.modal-overlay input[value="Send OTP"]',  # Specific to the HTML structure
+        '.modal-content .custom-button',
+        '.modal-content input[type="submit"]',
+        '.contact-form input[type="submit"]',
+        '.contact-form .custom-button',
+        'form input[value="Send OTP"]',
+        'form .custom-button',
+        '.modal-overlay button',  # Fallback to any button in modal
+        '.modal-content button',  # Fallback to any button in modal content
+    )
+    
+    # Signs that the OTP request went through: a confirmation text, or the
+    # OTP input appearing
+    OTP_SENT_SELECTORS = (':text-is("OTP sent")', ':text-is("Code sent")', ':text-is("Sent")')
+    OTP_APPEARED_SELECTORS = (
+        'input[placeholder*="OTP" i]',
+        'input[placeholder*="code" i]',
+        'input[placeholder*="verify" i]',
+        'input[maxlength="4"]',
+        'input[maxlength="6"]',
+        '.otp-input',
+    )
+    
+    # OTP input and the button that submits it
+    OTP_INPUT_SELECTORS = (
+        'input[name="otp"]',
+        'input[name="OTP"]',
+        'input[placeholder*="OTP" i]',
+        'input[placeholder*="code" i]',
+        'input[placeholder*="verify" i]',
+        'input[type="text"]:not([name="phone"]):not([name="mobile"])',
+        'input[type="number"]:not([name="phone"]):not([name="mobile"])',
+        'input.otp-input',
+        'input#otp',
+        'input[maxlength="6"]',
+    )
+    
+    # "Login to your account" link shown in the register modal
+    LOGIN_LINK_SELECTORS = (
+        'text="Login to your account"',
+        'a:has-text("Login to your account")',
+        '[style*="color: red"]:has-text("Login")',
+        '.text-red:has-text("Login")',
+        'a[href*="login"]',
+        '*:has-text("Login to your account")',
+        'a[style*="color"]',
+        '.login-link',
+    )
+    
+    LOADING_INDICATOR_SELECTORS = tuple(
+        (indicator, f'[class*="{indicator}"], [id*="{indicator}"]')
+        for indicator in ('loading', 'spinner', 'loader')
+    )
+    
+    VERIFY_BUTTON_SELECTORS = (
+        'button:has-text("Verify")',
+        'button:has-text("VERIFY")',
+        'button:has-text("Login")',
+        'button:has-text("LOGIN")',
+        'button:has-text("Submit")',
+        'button:has-text("SUBMIT")',
+        'button[type="submit"]',
+        'input[type="submit"]',
+        'button.btn-verify',
+        'button.verify-btn',
+        '.btn-primary',
+    )
+    
+    # Telegram table layout per academy short name, based on actual data
+    # patterns: (court numbers, time slots, compact column labels)
+    ACADEMY_TABLE_LAYOUTS = {
+        'Kotak': (
+            range(1, 7),  # Courts 1-6
+            ('12:00-13:00', '13:00-14:00', '18:00-19:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'),
+            ('12h', '13h', '18h', '19h', '20h', '21h'),
+        ),
+        'Pullela': (
+            range(1, 9),  # Courts 1-8
+            ('12:00-13:00', '13:00-14:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'),
+            ('12h', '13h', '19h', '20h', '21h'),
+        ),
+        'SAI': (
+            range(1, 10),  # Courts 1-9
+            ('12:00-13:00', '13:00-14:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'),
+            ('12h', '13h', '19h', '20h', '21h'),
+        ),
+    }
+    
     def __init__(self):
         # Get environment variables
         self.phone_number = os.getenv('PHONE_NUMBER')
         self.telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
         self.force_fresh_login = os.getenv('FORCE_FRESH_LOGIN', 'false').lower() == 'true'
+        # Optional already-running Chrome (started with --remote-debugging-port)
+        self.cdp_endpoint = os.getenv('CDP_ENDPOINT')
+        # Optional Chrome profile directory kept between runs
+        self.profile_dir = os.getenv('BROWSER_PROFILE_DIR')
+        self.profile_reused = False
         
         # Session files
-        self.data_dir = Path("data")
-        self.data_dir.mkdir(exist_ok=True)
-        self.cookies_file = self.data_dir / "github_cookies.json"
+        self.data_dir = Path("data")  # Created when the browser path first needs it
+        # Cookies used to live in their own file; now embedded in the session file
+        self.legacy_cookies_file = self.data_dir / "github_cookies.json"
         self.session_file = self.data_dir / "github_session.json"
+        self.seen_slots_file = self.data_dir / "seen_slots.json"
+        # Playwright's native cookies + localStorage snapshot, loaded straight
+        # into the browser context on the next run
+        self.storage_state_file = self.data_dir / "storage_state.json"
+        self.storage_state_loaded = False
+        # Fingerprint of the last session written, to skip identical saves
+        self._last_saved_hash = None
+        # Element handles per page, dropped whenever that page navigates
+        self._elem_cache = {}
+        # Court names per academy, read on the first date and reused after
+        self._court_names = {}
+        # Saved storage is injected through one init script per run
+        self._storage_init_registered = False
+        # Caps how many pages check dates at the same time
+        self._page_semaphore = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+        # Browser and context opened by the first browser check, kept for
+        # later checks until aclose()
+        self._browser = None
+        self._context = None
+        
+        # Only notify when slots appear that weren't open on the previous run
+        notification_settings = load_settings().get('notification_settings', {})
+        self.skip_repeat_notifications = notification_settings.get('skip_repeat_notifications', False)
         
         # Academy configurations
         self.academies = [
@@ -124,13 +456,54 @@ class GitHubActionsChecker:
     def send_telegram_message(self, message):
         """Send message via Telegram using helper function"""
         return send_telegram_message(self.telegram_token, self.chat_id, message)
+    
+    def send_results_message(self, message, slot_keys):
+        """
+        Send a results message unless it only repeats already-notified slots
+
+        The seen slots are only updated once the message was sent, so a failed
+        send gets the same slots reported again on the next run.
+        """
+        if not self.skip_repeat_notifications:
+            return self.send_telegram_message(message)
+        
+        seen = read_seen_slots(self.seen_slots_file)
+        if not diff_new_slots(slot_keys, seen):
+            logger.info("🔕 No new slots since last run - skipping notification")
+            # Still drop slots that were booked in the meantime
+            commit_seen_slots(self.seen_slots_file, slot_keys, seen)
+            return False
+        
+        sent = self.send_telegram_message(message)
+        if sent:
+            commit_seen_slots(self.seen_slots_file, slot_keys, seen)
+        else:
+            logger.warning("⚠️ Notification failed - new slots stay unseen for the next run")
+        return sent
+    
+    async def send_telegram_message_async(self, message):
+        """Send message via Telegram without blocking the event loop"""
+        return await send_telegram_message_async(self.telegram_token, self.chat_id, message)
+    
+    async def send_results_message_async(self, message, slot_keys):
+        """send_results_message run in a worker thread (it also touches the seen-slots file)"""
+        return await asyncio.to_thread(self.send_results_message, message, slot_keys)
 
     async def wait_for_otp_reply(self, timeout_minutes=5):
-        """Wait for OTP reply from user via Telegram"""
+        """
+        Wait for OTP reply from user via Telegram
+
+        The getUpdates long-polls run in a worker thread so the event loop
+        (and the open browser page) keeps running while the user replies.
+        """
         try:
+            # Polls share the pooled Telegram session, so the TLS connection
+            # is set up once rather than on every getUpdates call
+            session = get_telegram_session()
+            
             # Get the latest message ID to know where to start checking
             url = f"https://api.telegram.org/bot{self.telegram_token}/getUpdates"
-            response = requests.get(url, timeout=10)
+            response = await asyncio.to_thread(session.get, url, timeout=10)
             
             if response.status_code != 200:
                 logger.error("❌ Failed to get Telegram updates")
@@ -145,12 +518,12 @@ class GitHubActionsChecker:
             
             while (datetime.now() - start_time).total_seconds() < timeout_seconds:
                 # Check for new messages
-                url = f"https://api.telegram.org/bot{self.telegram_token}/getUpdates"
                 params = {'offset': last_update_id + 1, 'timeout': 10}
                 
                 try:
-                    response = requests.get(url, params=params, timeout=15)
+                    response = await asyncio.to_thread(session.get, url, params=params, timeout=15)
                     if response.status_code != 200:
+                        await asyncio.sleep(2)  # Back off before retrying a failed poll
                         continue
                         
                     updates = response.json().get('result', [])
@@ -170,10 +543,11 @@ class GitHubActionsChecker:
                         
                 except Exception as e:
                     logger.warning(f"⚠️ Error checking for updates: {e}")
+                    await asyncio.sleep(2)  # Back off before retrying a failed poll
                     continue
-                    
-                # Small delay between checks
-                await asyncio.sleep(2)
+                
+                # No delay between successful polls - getUpdates long-polls for
+                # up to 10s itself and returns as soon as a message arrives
             
             logger.warning(f"⏰ OTP timeout after {timeout_minutes} minutes")
             return None
@@ -182,9 +556,9 @@ class GitHubActionsChecker:
             logger.error(f"❌ Error waiting for OTP: {e}")
             return None
     
-    def get_check_dates(self):
+    def get_check_dates(self, now=None):
         """Get dates to check based on configuration using helper function"""
-        dates_info = get_check_dates()
+        dates_info = get_check_dates(now)
         # Extract just the date strings for API calls
         return [info['date'] for info in dates_info.values()]
     
@@ -193,21 +567,39 @@ class GitHubActionsChecker:
         try:
             logger.info("💾 Saving session state...")
             
-            cookies = await page.context.cookies()
-            local_storage = {}
-            session_storage = {}
-            
-            try:
-                local_storage = await page.evaluate("() => Object.assign({}, localStorage)")
-                logger.info(f"💾 Captured {len(local_storage)} localStorage items")
-            except Exception as e:
-                logger.warning(f"Failed to capture localStorage: {e}")
+            # The three reads are independent, so issue them together and
+            # pay one browser round-trip instead of three
+            cookies, raw_snapshot, storage_state = await asyncio.gather(
+                page.context.cookies(),
+                page.evaluate(SESSION_SNAPSHOT_JS),
+                page.context.storage_state(),
+                return_exceptions=True
+            )
+            if isinstance(cookies, Exception):
+                raise cookies
             
+            snapshot = {'ls': {}, 'ss': {}, 'ua': None, 'url': page.url}
             try:
-                session_storage = await page.evaluate("() => Object.assign({}, sessionStorage)")
-                logger.info(f"💾 Captured {len(session_storage)} sessionStorage items")
+                if isinstance(raw_snapshot, Exception):
+                    raise raw_snapshot
+                snapshot = loads_json(raw_snapshot)
+                logger.info(f"💾 Captured {len(snapshot['ls'])} localStorage and "
+                            f"{len(snapshot['ss'])} sessionStorage items")
             except Exception as e:
-                logger.warning(f"Failed to capture sessionStorage: {e}")
+                logger.warning(f"Failed to capture browser storage: {e}")
+            
+            local_storage = snapshot['ls']
+            session_storage = snapshot['ss']
+            
+            # Skip the write if nothing changed since the last save this run
+            session_hash = hash((
+                tuple(sorted((c['name'], c['value'], c['domain']) for c in cookies)),
+                tuple(sorted(local_storage.items())),
+                tuple(sorted(session_storage.items()))
+            ))
+            if session_hash == self._last_saved_hash:
+                logger.info("💾 Session unchanged since last save - skipping write")
+                return True
             
             # Validate we have meaningful session data
             if len(cookies) == 0:
@@ -216,39 +608,39 @@ class GitHubActionsChecker:
             # Ensure data directory exists
             self.data_dir.mkdir(exist_ok=True)
             
-            logger.info(f"🍪 Saving {len(cookies)} cookies to {self.cookies_file}")
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f, indent=2)
-            
             session_data = {
-                'url': page.url,
-                'timestamp': datetime.now().isoformat(),
+                'url': snapshot['url'],
+                'timestamp': time.time(),
+                'timestamp_human': datetime.now().isoformat(),
                 'local_storage': local_storage,
                 'session_storage': session_storage,
+                'cookies': cookies,
                 'cookies_count': len(cookies),
-                'user_agent': await page.evaluate('navigator.userAgent')
+                'user_agent': snapshot['ua']
             }
             
-            logger.info(f"📄 Saving session data to {self.session_file}")
-            with open(self.session_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            # One file holding cookies and storage - one write here, one read
+            # and parse on restore
+            logger.info(f"📄 Saving session data and {len(cookies)} cookies to {self.session_file}")
+            write_json(self.session_file, session_data, backup=True)
             
-            logger.info(f"✅ Session saved successfully: {len(cookies)} cookies, timestamp: {session_data['timestamp']}")
+            # The cookies now live in the session file - drop the old copy
+            if self.legacy_cookies_file.exists():
+                self.legacy_cookies_file.unlink()
+            
+            # Playwright's own snapshot (cookies + localStorage per origin)
+            try:
+                if isinstance(storage_state, Exception):
+                    raise storage_state
+                write_json(self.storage_state_file, storage_state)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not save storage state: {e}")
+            
+            logger.info(f"✅ Session saved successfully: {len(cookies)} cookies, timestamp: {session_data['timestamp_human']}")
             
             # Comprehensive file validation
             validation_success = True
             
-            if not self.cookies_file.exists():
-                logger.error("❌ Cookies file was not created!")
-                validation_success = False
-            else:
-                cookies_size = self.cookies_file.stat().st_size
-                if cookies_size < 50:  # Expect at least some content
-                    logger.error(f"❌ Cookies file too small: {cookies_size} bytes")
-                    validation_success = False
-                else:
-                    logger.info(f"✅ Cookies file created: {cookies_size} bytes")
-            
             if not self.session_file.exists():
                 logger.error("❌ Session file was not created!")
                 validation_success = False
@@ -262,23 +654,16 @@ class GitHubActionsChecker:
             
             # Test read-back to ensure files are not corrupted
             try:
-                with open(self.cookies_file, 'r') as f:
-                    test_cookies = json.load(f)
-                logger.info(f"✅ Cookies file read-back test passed: {len(test_cookies)} cookies")
-            except Exception as e:
-                logger.error(f"❌ Cookies file read-back test failed: {e}")
-                validation_success = False
-            
-            try:
-                with open(self.session_file, 'r') as f:
-                    test_session = json.load(f)
-                logger.info(f"✅ Session file read-back test passed: {test_session.get('timestamp', 'no timestamp')}")
+                test_session = read_json(self.session_file)
+                logger.info(f"✅ Session file read-back test passed: {test_session.get('timestamp_human', 'no timestamp')}, "
+                            f"{len(test_session.get('cookies', []))} cookies")
             except Exception as e:
                 logger.error(f"❌ Session file read-back test failed: {e}")
                 validation_success = False
             
             if validation_success:
                 logger.info("🎉 Session save validation: ALL CHECKS PASSED")
+                self._last_saved_hash = session_hash
                 return True
             else:
                 logger.error("💥 Session save validation: SOME CHECKS FAILED")
@@ -293,35 +678,33 @@ class GitHubActionsChecker:
         try:
             logger.info("🔍 Attempting to restore session...")
             
-            # Check if session files exist
-            if not self.session_file.exists():
+            # One stat answers existence, size and a first age check. The
+            # mtime is never older than the save itself, so a file that looks
+            # too old is too old - no need to read and parse it.
+            try:
+                session_stat = self.session_file.stat()
+            except FileNotFoundError:
                 logger.info(f"❌ Session file not found: {self.session_file}")
                 return False
             
-            if not self.cookies_file.exists():
-                logger.info(f"❌ Cookies file not found: {self.cookies_file}")
+            if time.time() - session_stat.st_mtime > SESSION_MAX_AGE_SECONDS:
+                logger.info("⏰ Session file too old, need fresh login")
                 return False
             
-            logger.info("✅ Session files found, validating content...")
-            
-            # Validate file sizes
-            cookies_size = self.cookies_file.stat().st_size
-            session_size = self.session_file.stat().st_size
+            logger.info("✅ Session file found, validating content...")
             
-            if cookies_size < 50:
-                logger.error(f"❌ Cookies file too small: {cookies_size} bytes - likely corrupted")
-                return False
+            # Validate file size
+            session_size = session_stat.st_size
             
             if session_size < 100:
                 logger.error(f"❌ Session file too small: {session_size} bytes - likely corrupted")
                 return False
             
-            logger.info(f"✅ File sizes look good - cookies: {cookies_size} bytes, session: {session_size} bytes")
+            logger.info(f"✅ File size looks good - session: {session_size} bytes")
             
             # Load and validate session data
             try:
-                with open(self.session_file, 'r') as f:
-                    session_data = json.load(f)
+                session_data = read_json(self.session_file, backup=True)
             except json.JSONDecodeError as e:
                 logger.error(f"❌ Session file is corrupted (invalid JSON): {e}")
                 return False
@@ -334,23 +717,35 @@ class GitHubActionsChecker:
                     return False
             
             # Check session age (allow up to 7 days to match artifact retention)
-            session_time = datetime.fromisoformat(session_data['timestamp'])
-            age_hours = (datetime.now() - session_time).total_seconds() / 3600
+            age_hours = age_seconds(session_data['timestamp']) / 3600
             
             logger.info(f"📅 Session age: {age_hours:.1f} hours")
             
-            if age_hours > (7 * 24):  # 7 days
+            if age_hours * 3600 > SESSION_MAX_AGE_SECONDS:
                 logger.info(f"⏰ Session too old ({age_hours/24:.1f} days), need fresh login")
                 return False
             
-            # Load and validate cookies
-            try:
-                with open(self.cookies_file, 'r') as f:
-                    cookies = json.load(f)
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ Cookies file is corrupted (invalid JSON): {e}")
+            # The site authenticates with the loginToken it keeps in
+            # localStorage - without one, restoring and verifying (a page
+            # load plus API probe) can only end in a fresh login
+            if not session_data.get('local_storage', {}).get('loginToken'):
+                logger.info("❌ Saved session has no loginToken, need fresh login")
                 return False
             
+            # Cookies come from the session file; sessions saved before they
+            # were embedded still have them in the old separate file
+            cookies = session_data.get('cookies')
+            if cookies is None:
+                try:
+                    cookies = read_json(self.legacy_cookies_file, backup=True)
+                    logger.info(f"🍪 Read cookies from legacy file {self.legacy_cookies_file}")
+                except FileNotFoundError:
+                    logger.info(f"❌ No cookies in session file and no {self.legacy_cookies_file}")
+                    return False
+                except json.JSONDecodeError as e:
+                    logger.error(f"❌ Cookies file is corrupted (invalid JSON): {e}")
+                    return False
+            
             if not isinstance(cookies, list):
                 logger.error(f"❌ Cookies data is not a list: {type(cookies)}")
                 return False
@@ -360,51 +755,47 @@ class GitHubActionsChecker:
             
             logger.info(f"🍪 Loading {len(cookies)} cookies...")
             
-            # Restore cookies with validation
+            # Restore cookies with validation - only the ones the context
+            # doesn't already hold (e.g. a reused CDP/profile browser)
             try:
-                await page.context.add_cookies(cookies)
-                logger.info(f"✅ Restored {len(cookies)} cookies successfully")
+                current = {
+                    (c['name'], c['domain'], c.get('path')): c.get('value')
+                    for c in await page.context.cookies()
+                }
+                changed = [
+                    c for c in cookies
+                    if current.get((c['name'], c['domain'], c.get('path'))) != c.get('value')
+                ]
+                if changed:
+                    await page.context.add_cookies(changed)
+                    logger.info(f"✅ Restored {len(changed)}/{len(cookies)} cookies successfully")
+                else:
+                    logger.info("✅ Cookies already match saved session - nothing to restore")
             except Exception as e:
                 logger.error(f"❌ Failed to restore cookies: {e}")
                 return False
             
+            # Seed localStorage/sessionStorage before any site JS runs on every
+            # page of this context. Keys already present are left alone so a
+            # fresher token (e.g. from a later login) is never overwritten.
+            await self._register_storage_init(
+                page.context, session_data['url'],
+                session_data.get('local_storage', {}),
+                session_data.get('session_storage', {})
+            )
+            
             # Navigate to test page with longer timeout
             logger.info("🌐 Navigating to test page...")
             try:
                 await page.goto(session_data.get('url', 'https://booking.gopichandacademy.com/'), 
-                               wait_until='networkidle', timeout=20000)
-                await asyncio.sleep(5)  # Give extra time for page to load
+                               wait_until='commit', timeout=20000)
             except Exception as e:
                 logger.error(f"❌ Failed to navigate to test page: {e}")
                 return False
-            
-            # Restore local storage
-            local_storage = session_data.get('local_storage', {})
-            logger.info(f"💾 Restoring {len(local_storage)} localStorage items...")
-            restored_local = 0
-            for key, value in local_storage.items():
-                try:
-                    await page.evaluate(f"localStorage.setItem({json.dumps(key)}, {json.dumps(value)})")
-                    restored_local += 1
-                except Exception as e:
-                    logger.debug(f"Failed to restore localStorage {key}: {e}")
-            
-            if restored_local > 0:
-                logger.info(f"✅ Successfully restored {restored_local}/{len(local_storage)} localStorage items")
-            
-            # Restore session storage
-            session_storage = session_data.get('session_storage', {})
-            logger.info(f"💾 Restoring {len(session_storage)} sessionStorage items...")
-            restored_session = 0
-            for key, value in session_storage.items():
-                try:
-                    await page.evaluate(f"sessionStorage.setItem({json.dumps(key)}, {json.dumps(value)})")
-                    restored_session += 1
-                except Exception as e:
-                    logger.debug(f"Failed to restore sessionStorage {key}: {e}")
-            
-            if restored_session > 0:
-                logger.info(f"✅ Successfully restored {restored_session}/{len(session_storage)} sessionStorage items")
+            try:
+                await page.wait_for_selector(APP_READY_SELECTOR, timeout=10000)
+            except Exception:
+                logger.debug("App shell did not render after session restore navigation")
             
             logger.info("✅ Session restored successfully - now verifying...")
             return True
@@ -413,6 +804,52 @@ class GitHubActionsChecker:
             logger.error(f"❌ Session restore failed with exception: {e}")
             return False
     
+    async def _register_storage_init(self, context, session_url, local_storage, session_storage):
+        """Seed the saved localStorage/sessionStorage on every page of context (once per run)"""
+        if self._storage_init_registered:
+            return
+        session_url = urlsplit(session_url)
+        await context.add_init_script(STORAGE_RESTORE_JS % (
+            json.dumps(f"{session_url.scheme}://{session_url.netloc}"),
+            json.dumps(local_storage),
+            json.dumps(session_storage)
+        ))
+        self._storage_init_registered = True
+        logger.info(f"💾 Seeding {len(local_storage)} localStorage and "
+                    f"{len(session_storage)} sessionStorage items on page load")
+    
+    async def _open_start_page(self, page):
+        """
+        Open the booking site on a context that already carries the login
+
+        Cookies and localStorage come with the storage state or profile, but
+        sessionStorage is in neither, so it is still seeded from the session
+        file (when there is a recent one) before the first navigation.
+        """
+        try:
+            session_data = read_json(self.session_file, backup=True)
+            if age_seconds(session_data['timestamp']) <= SESSION_MAX_AGE_SECONDS:
+                await self._register_storage_init(
+                    page.context, session_data['url'], {},
+                    session_data.get('session_storage', {})
+                )
+        except FileNotFoundError:
+            logger.debug(f"No {self.session_file} - no sessionStorage to seed")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"⚠️ Could not seed sessionStorage from {self.session_file}: {e}")
+        
+        try:
+            await page.goto('https://booking.gopichandacademy.com/',
+                            wait_until='commit', timeout=20000)
+        except Exception as e:
+            logger.error(f"❌ Failed to open booking site: {e}")
+            return False
+        try:
+            await page.wait_for_selector(APP_READY_SELECTOR, timeout=10000)
+        except Exception:
+            logger.debug("App shell did not render on the start page")
+        return True
+    
     async def restore_session_with_retry(self, page, max_retries=3):
         """Restore session with retry logic"""
         for attempt in range(1, max_retries + 1):
@@ -464,38 +901,66 @@ class GitHubActionsChecker:
         try:
             logger.info("🔍 Verifying login status...")
             
-            # Wait a bit for the page to fully load
-            await asyncio.sleep(3)
+            # Storage is seeded by the init script before the page's own
+            # scripts run, so only wait until the SPA has rendered its shell
+            try:
+                await page.wait_for_selector(APP_READY_SELECTOR, timeout=3000)
+            except Exception:
+                logger.debug("App shell not rendered before login verification")
+            
+            # Fast pre-check: the site keeps its auth token in localStorage,
+            # so without one there is no point probing or navigating
+            token = None
+            try:
+                token = await page.evaluate("() => localStorage.getItem('loginToken')")
+                if not token:
+                    logger.info("❌ No loginToken in localStorage - not logged in")
+                    return False
+            except Exception as e:
+                logger.debug(f"Could not read localStorage: {e}")
+            has_token = bool(token)
             
             # Check multiple login indicators
             login_indicators = []
             
-            # 1. Check for logout button
+            # 1./2. Check for a logout button or user profile/menu - both are
+            # polled in the page by one wait instead of two sequential 5s waits
             try:
-                logout_button = await page.wait_for_selector('[data-testid="logout-button"], .logout-btn, button:has-text("Logout"), button:has-text("Log Out")', 
-                                                            timeout=5000)
-                if logout_button:
+                ui_handle = await page.wait_for_function(LOGGED_IN_UI_JS, timeout=5000)
+                logged_in_ui = await ui_handle.json_value()
+                if logged_in_ui['logout']:
                     login_indicators.append("logout_button")
                     logger.info("✅ Found logout button")
-            except:
-                logger.debug("❌ No logout button found")
-            
-            # 2. Check for user profile/menu
-            try:
-                profile_element = await page.wait_for_selector('.user-profile, .user-menu, [data-testid="user-menu"]', 
-                                                             timeout=5000)
-                if profile_element:
+                if logged_in_ui['profile']:
                     login_indicators.append("profile_menu")
                     logger.info("✅ Found user profile menu")
-            except:
-                logger.debug("❌ No user profile menu found")
+            except PlaywrightError:
+                logger.debug("❌ No logout button or user profile menu found")
+            
+            # Token plus a logged-in UI element is enough - skip the navigation
+            if has_token and login_indicators:
+                logger.info(f"✅ Login verified! loginToken present and found {login_indicators}")
+                return True
+            
+            # 3. Ask the Profile API directly - the SPA answers every route with
+            # 200, so the API is the authoritative signal and needs no
+            # navigation. Only fall back to loading a page if it can't answer.
+            probe = await self._probe_profile_api(page.context, token)
             
-            # 3. Test access to a protected page
+            if probe.get('valid'):
+                logger.info("✅ Login verified! Profile API accepted the loginToken")
+                return True
+            if probe.get('status') in (200, 401, 403):
+                logger.info(f"❌ Profile API rejected the loginToken (status {probe['status']})")
+                return False
+            logger.debug(f"Profile API probe inconclusive: {probe}")
+            
+            # 3b. Test access to a protected page
             try:
                 logger.info("🌐 Testing access to protected page...")
                 await page.goto('https://booking.gopichandacademy.com/venue-details/1', 
-                               wait_until='domcontentloaded', timeout=15000)
-                await asyncio.sleep(3)
+                               wait_until='commit', timeout=15000)
+                await self._wait_for_booking_page(page)
                 
                 current_url = page.url
                 logger.info(f"📍 Current URL after navigation: {current_url}")
@@ -509,18 +974,20 @@ class GitHubActionsChecker:
             except Exception as e:
                 logger.debug(f"❌ Failed to test protected page access: {e}")
             
-            # 4. Check for booking page elements
+            # 4. Check for booking page elements (auth data for step 6 comes
+            # back from the same evaluate)
+            page_state = {}
             try:
-                date_input = await page.query_selector('input#card1[type="date"]')
-                if date_input:
+                page_state = await page.evaluate(PAGE_LOGIN_STATE_JS)
+                if page_state['date']:
                     login_indicators.append("booking_elements")
                     logger.info("✅ Found booking page elements")
                     
                     # Double-check by looking for other booking elements
-                    court_elements = await page.query_selector_all('div.court-item')
-                    if court_elements:
+                    court_count = page_state['courts']
+                    if court_count:
                         login_indicators.append("court_elements")
-                        logger.info(f"✅ Found {len(court_elements)} court elements")
+                        logger.info(f"✅ Found {court_count} court elements")
                 else:
                     logger.debug("❌ No booking date input found")
             except Exception as e:
@@ -537,30 +1004,16 @@ class GitHubActionsChecker:
                         logger.info("✅ Login modal is hidden")
                     else:
                         logger.debug("❌ Login modal is visible")
-            except:
+            except PlaywrightTimeoutError:
                 # Timeout is good - means no modal found
                 login_indicators.append("no_modal_found")
                 logger.info("✅ No login modal found")
             
             # 6. Check localStorage for auth tokens
-            try:
-                auth_data = await page.evaluate("""
-                    () => {
-                        const token = localStorage.getItem('authToken') || 
-                                    localStorage.getItem('auth_token') || 
-                                    localStorage.getItem('token') ||
-                                    localStorage.getItem('user_token');
-                        const user = localStorage.getItem('user') ||
-                                   localStorage.getItem('userData') ||
-                                   localStorage.getItem('currentUser');
-                        return { token: !!token, user: !!user };
-                    }
-                """)
-                
-                if auth_data.get('token') or auth_data.get('user'):
-                    login_indicators.append("auth_data_present")
-                    logger.info("✅ Authentication data found in localStorage")
-            except:
+            if page_state.get('token') or page_state.get('user'):
+                login_indicators.append("auth_data_present")
+                logger.info("✅ Authentication data found in localStorage")
+            else:
                 logger.debug("❌ No authentication data in localStorage")
             
             # Decision logic
@@ -575,20 +1028,23 @@ class GitHubActionsChecker:
                 
                 # Debug: Check what elements are actually present
                 try:
-                    all_inputs = await page.query_selector_all('input')
-                    logger.info(f"🔍 Debug: Found {len(all_inputs)} input elements on page")
+                    input_count = await page.eval_on_selector_all('input', 'els => els.length')
+                    logger.info(f"🔍 Debug: Found {input_count} input elements on page")
                     
                     # Check page title for more context
                     title = await page.title()
                     logger.info(f"📄 Page title: {title}")
-                except:
+                except PlaywrightError:
                     pass
                 
                 # Take screenshot for debugging
-                if self.github_mode:
-                    screenshot_path = f"data/from_github/verify_login_failed.png"
-                    await page.screenshot(path=screenshot_path)
-                    logger.info(f"📷 Debug screenshot saved: {screenshot_path}")
+                if os.getenv('GITHUB_ACTIONS') == 'true':
+                    screenshot_path = "data/from_github/verify_login_failed.png"
+                    try:
+                        await page.screenshot(path=screenshot_path)
+                        logger.info(f"📷 Debug screenshot saved: {screenshot_path}")
+                    except PlaywrightError as e:
+                        logger.debug(f"Could not save debug screenshot: {e}")
                 
                 return False
             
@@ -596,6 +1052,133 @@ class GitHubActionsChecker:
             logger.error(f"❌ Login verification failed: {e}")
             return False
     
+    async def _probe_profile_api(self, context, token):
+        """
+        Call the Profile API with token through the context's request client
+
+        A plain HTTP request - no page load, and no dependency on the page
+        being on the booking origin. Returns {status, valid} (status 0 when
+        there is no token, -1 when the request itself failed).
+        """
+        if not token:
+            return {'status': 0}
+        try:
+            response = await context.request.get(
+                PROFILE_API_URL, headers={'LoginToken': token}, max_redirects=0, timeout=10000
+            )
+        except PlaywrightError as e:
+            return {'status': -1, 'error': str(e)}
+        try:
+            body = await response.json()
+        except Exception:
+            body = None
+        return {
+            'status': response.status,
+            'valid': isinstance(body, dict) and body.get('Status') == 'Success'
+        }
+    
+    async def _first_matching(self, page, selectors, timeout, require_enabled=False):
+        """
+        Find the highest-priority visible element among selectors
+
+        All selectors are raced in a single wait, so a miss costs one timeout
+        rather than one per selector. Once something is visible the list is
+        triaged in one evaluate and walked in order to keep the original
+        priority; only visible or non-CSS selectors cost a handle lookup.
+        Returns (selector, element), or (None, None) if nothing usable appears.
+        """
+        try:
+            await page.wait_for_selector(selector_group(selectors), state='visible', timeout=timeout)
+        except Exception:
+            return None, None
+        
+        try:
+            visibility = await page.evaluate(SELECTOR_VISIBILITY_JS, list(selectors))
+        except Exception:
+            visibility = [None] * len(selectors)
+        
+        for selector, state in zip(selectors, visibility):
+            if state == 0:
+                continue
+            try:
+                element = await page.query_selector(selector)
+                if not element or not await element.is_visible():
+                    continue
+                if require_enabled and not await element.is_enabled():
+                    logger.info(f"⚠️ Found element but not enabled: {selector}")
+                    continue
+                return selector, element
+            except Exception:
+                continue
+        return None, None
+    
+    async def _first_signal(self, waits):
+        """
+        Await several named waits at once and return the name of the first
+        one that succeeds, cancelling the rest; None if all of them fail
+        """
+        tasks = {asyncio.create_task(wait): name for name, wait in waits.items()}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.exception():
+                        return tasks[task]
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    async def _race_first_matching(self, page, groups, timeout):
+        """
+        Run _first_matching for several named selector groups at once
+
+        Returns (group name, selector) for the first group that finds a
+        visible element, cancelling the others, or (None, None) once every
+        group has timed out - so a miss costs one timeout, not one per group.
+        """
+        found = {}
+        
+        async def match(name, selectors):
+            selector, _ = await self._first_matching(page, selectors, timeout)
+            if not selector:
+                raise LookupError(name)  # A miss counts as a failed wait
+            found[name] = selector
+        
+        group = await self._first_signal({
+            name: match(name, selectors) for name, selectors in groups.items()
+        })
+        return (group, found[group]) if group else (None, None)
+    
+    async def _prefetch_academy_pages(self, context):
+        """Load each academy page once in a throwaway tab to warm the HTTP cache"""
+        page = await context.new_page()
+        try:
+            for academy in self.academies:
+                await page.goto(academy['url'], wait_until='commit', timeout=20000)
+                await self._wait_for_booking_page(page)
+            logger.info("🔥 Prefetched academy pages during OTP wait")
+        except Exception as e:
+            logger.debug(f"Academy prefetch failed: {e}")
+        finally:
+            await page.close()
+    
+    async def _wait_for_modal(self, page, timeout=5000):
+        """Wait for the login modal to become visible, returning it or None"""
+        try:
+            return await page.wait_for_selector('.modal-overlay', state='visible', timeout=timeout)
+        except Exception:
+            return None
+    
+    async def _wait_for_phone_input(self, page, timeout=5000):
+        """Wait for the login form's phone input after switching modals"""
+        try:
+            await page.wait_for_selector(self.PHONE_SELECTOR, state='visible', timeout=timeout)
+        except Exception:
+            logger.debug("Phone input not visible after switching to login modal")
+    
     async def interactive_login(self, page):
         """Interactive login with OTP via Telegram"""
         try:
@@ -617,36 +1200,39 @@ class GitHubActionsChecker:
             # Use longer timeouts for GitHub Actions
             nav_timeout = 45000 if is_github_actions else 30000
             
+            # networkidle rarely settles on this site (analytics beacons), so
+            # return once the response commits and wait for the login button
             await page.goto('https://booking.gopichandacademy.com/', 
-                           wait_until='networkidle', timeout=nav_timeout)
+                           wait_until='commit', timeout=nav_timeout)
             
-            # Log page info after navigation
+            # Wait for the React SPA to render the login button
+            logger.info("⏳ Waiting for React SPA to initialize...")
+            try:
+                await page.wait_for_selector('.login-btn, [class*="login-btn"]', timeout=10000)
+            except Exception:
+                logger.warning("⚠️ Login button not rendered yet - trying fallback selectors")
+            
+            # Log page info after the SPA rendered
             title = await page.title()
             url = page.url
             logger.info(f"📄 Page loaded - Title: '{title}', URL: '{url}'")
             
-            # Wait longer for dynamic content to load
-            logger.info("⏳ Waiting for React SPA to initialize...")
-            await asyncio.sleep(10)
-            
             # Check if there are any scripts or dynamic content loading
-            scripts = await page.query_selector_all('script')
-            logger.info(f"🔧 Found {len(scripts)} script tags on page")
+            script_count = await page.eval_on_selector_all('script', 'els => els.length')
+            logger.info(f"🔧 Found {script_count} script tags on page")
             
             # Find and click the "Login / SignUp" button to open the modal
             logger.info("🔍 Looking for 'Login / SignUp' button...")
             login_found = False
             
-            # The specific selector for the Login/SignUp button based on the HTML
-            login_btn_selectors = [
-                '.login-btn',
-                '[class*="login-btn"]',
-                'div:has-text("Login / ")',
-                'div:has-text("SignUp")',
-                'span:has-text("Login /")',
-            ]
+            # One grouped lookup first - when none of the buttons exist the
+            # per-selector loop below would only cost a round-trip each
+            try:
+                any_login_button = await page.query_selector(selector_group(self.LOGIN_BUTTON_SELECTORS))
+            except Exception:
+                any_login_button = True
             
-            for selector in login_btn_selectors:
+            for selector in (self.LOGIN_BUTTON_SELECTORS if any_login_button else ()):
                 try:
                     login_element = await page.query_selector(selector)
                     if login_element:
@@ -657,10 +1243,7 @@ class GitHubActionsChecker:
                         logger.info("� Clicked login button - modal should appear")
                         
                         # Wait for modal to appear
-                        await asyncio.sleep(3)
-                        
-                        # Check if modal appeared by looking for modal-overlay
-                        modal = await page.query_selector('.modal-overlay')
+                        modal = await self._wait_for_modal(page)
                         if modal:
                             logger.info("✅ Login modal appeared!")
                             
@@ -701,7 +1284,7 @@ class GitHubActionsChecker:
                                     
                                     # Click the "Login to your account" red link
                                     await login_link.click()
-                                    await asyncio.sleep(3)
+                                    await self._wait_for_phone_input(page)
                                     
                                     # Take screenshot after clicking login link
                                     await page.screenshot(path='data/debug_after_login_click.png')
@@ -713,19 +1296,8 @@ class GitHubActionsChecker:
                                     # This is likely a register modal, try alternative selectors for the login link
                                     logger.info("📝 Register modal detected - looking for login link with alternative selectors...")
                                     
-                                    login_link_selectors = [
-                                        'text="Login to your account"',
-                                        'a:has-text("Login to your account")',
-                                        '[style*="color: red"]:has-text("Login")',
-                                        '.text-red:has-text("Login")',
-                                        'a[href*="login"]',
-                                        '*:has-text("Login to your account")',
-                                        'a[style*="color"]',
-                                        '.login-link'
-                                    ]
-                                    
                                     link_clicked = False
-                                    for selector in login_link_selectors:
+                                    for selector in self.LOGIN_LINK_SELECTORS:
                                         try:
                                             link = await modal.query_selector(selector)
                                             if link:
@@ -736,7 +1308,7 @@ class GitHubActionsChecker:
                                                 await page.screenshot(path=f'data/debug_before_link_{safe_selector}.png')
                                                 
                                                 await link.click()
-                                                await asyncio.sleep(3)
+                                                await self._wait_for_phone_input(page)
                                                 
                                                 # Take screenshot after click
                                                 await page.screenshot(path=f'data/debug_after_link_{safe_selector}.png')
@@ -761,7 +1333,7 @@ class GitHubActionsChecker:
                                                 text = await link.inner_text()
                                                 tag = await link.evaluate('el => el.tagName')
                                                 logger.info(f"   Clickable {i+1}: {tag} - '{text[:50]}'")
-                                            except:
+                                            except PlaywrightError:
                                                 pass
                                 else:
                                     logger.info("✅ Login modal is already showing (not register modal)")
@@ -790,9 +1362,8 @@ class GitHubActionsChecker:
                     # Use more specific text matching
                     await page.click('text=Login / SignUp', timeout=5000)
                     logger.info("� Clicked 'Login / SignUp' text")
-                    await asyncio.sleep(3)
                     
-                    modal = await page.query_selector('.modal-overlay')
+                    modal = await self._wait_for_modal(page)
                     if modal:
                         logger.info("✅ Login modal appeared after text click!")
                         login_found = True
@@ -812,9 +1383,8 @@ class GitHubActionsChecker:
                             if 'Login' in text or 'SignUp' in text:
                                 logger.info(f"🎯 Found login element in header: '{text}'")
                                 await element.click()
-                                await asyncio.sleep(3)
                                 
-                                modal = await page.query_selector('.modal-overlay')
+                                modal = await self._wait_for_modal(page)
                                 if modal:
                                     logger.info("✅ Login modal appeared after header click!")
                                     login_found = True
@@ -823,23 +1393,23 @@ class GitHubActionsChecker:
                     logger.debug(f"⚠️ Header click failed: {e}")
             
             # Check for common loading indicators
-            loading_indicators = ['loading', 'spinner', 'loader']
-            for indicator in loading_indicators:
-                elements = await page.query_selector_all(f'[class*="{indicator}"], [id*="{indicator}"]')
-                if elements:
+            for indicator, selector in self.LOADING_INDICATOR_SELECTORS:
+                indicator_count = await page.eval_on_selector_all(selector, 'els => els.length')
+                if indicator_count:
                     logger.info(f"🔄 Found loading indicator: {indicator}")
             
-            # Try waiting for any input to appear
-            logger.info("🔍 Waiting for any input element to appear...")
+            # Wait for the phone input specifically - a bare 'input' selector
+            # also matches unrelated inputs elsewhere on the page
+            logger.info("🔍 Waiting for phone input element to appear...")
             try:
-                await page.wait_for_selector('input', timeout=15000)
-                logger.info("✅ Input element appeared after waiting")
+                await page.wait_for_selector(self.PHONE_SELECTOR, timeout=15000)
+                logger.info("✅ Phone input appeared after waiting")
             except Exception:
-                logger.warning("⚠️ No input elements appeared after 15 seconds")
+                logger.warning("⚠️ Phone input did not appear after 15 seconds")
             
             # Check again after waiting
-            all_inputs_after_wait = await page.query_selector_all('input')
-            logger.info(f"📝 Found {len(all_inputs_after_wait)} input elements after waiting")
+            input_count_after_wait = await page.eval_on_selector_all('input', 'els => els.length')
+            logger.info(f"📝 Found {input_count_after_wait} input elements after waiting")
             
             # Check for iframes that might contain the login form
             iframes = await page.query_selector_all('iframe')
@@ -876,71 +1446,19 @@ class GitHubActionsChecker:
             
             logger.info("✅ Modal overlay found, looking for form elements...")
             
-            # Based on the HTML structure, the phone input has specific attributes
-            modal_phone_selectors = [
-                '.modal-overlay input[id="mobile"]',  # Based on the HTML: <input ... id="mobile">
-                '.modal-overlay input[placeholder*="Mobile Number" i]',  # Placeholder: "Enter Your Mobile Number"
-                '.modal-overlay input[type="text"]',  # It's type="text" not "tel"
-                '.modal-overlay input[maxlength="10"]',  # Has maxlength="10"
-                '.modal-content input[id="mobile"]',
-                '.modal-content input',
-                '.contact-form input[id="mobile"]',
-                '.contact-form input',
-                'form input[id="mobile"]',
-                'input[id="mobile"]'  # Fallback to just the ID
-            ]
-            
-            for selector in modal_phone_selectors:
-                try:
-                    phone_input = await page.wait_for_selector(selector, timeout=5000)
-                    if phone_input:
-                        logger.info(f"✅ Found phone input in modal: {selector}")
-                        
-                        # Verify it's the right input by checking attributes
-                        input_id = await phone_input.get_attribute('id')
-                        input_placeholder = await phone_input.get_attribute('placeholder')
-                        input_type = await phone_input.get_attribute('type')
-                        input_maxlength = await phone_input.get_attribute('maxlength')
-                        
-                        logger.info(f"📝 Input details - ID: '{input_id}', Placeholder: '{input_placeholder}', Type: '{input_type}', MaxLength: '{input_maxlength}'")
-                        break
-                        
-                except Exception as e:
-                    logger.debug(f"⚠️ Modal selector {selector} failed: {e}")
-                    continue
-            
-            if not phone_input:
-                logger.error("❌ Phone input field not found within modal")
+            # One locator over all known phone input variants, first match wins
+            phone_input = page.locator(self.PHONE_SELECTOR).first
+            try:
+                await phone_input.wait_for(state='visible', timeout=5000)
                 
-                # Enhanced debugging - check what's in the modal
-                try:
-                    modal_content = await modal.inner_html()
-                    logger.error("🔍 Modal content analysis:")
-                    
-                    # Look for all inputs in modal
-                    modal_inputs = await modal.query_selector_all('input')
-                    logger.error(f"📝 Found {len(modal_inputs)} input elements in modal:")
-                    
-                    for i, inp in enumerate(modal_inputs):
-                        input_type = await inp.get_attribute('type') or 'no-type'
-                        input_name = await inp.get_attribute('name') or 'no-name'
-                        input_id = await inp.get_attribute('id') or 'no-id'
-                        input_placeholder = await inp.get_attribute('placeholder') or 'no-placeholder'
-                        input_class = await inp.get_attribute('class') or 'no-class'
-                        logger.error(f"  Modal Input #{i+1}: type='{input_type}', name='{input_name}', id='{input_id}', placeholder='{input_placeholder}', class='{input_class}'")
-                    
-                    # Save modal content for analysis
-                    with open('data/modal_content.html', 'w', encoding='utf-8') as f:
-                        f.write(modal_content)
-                    logger.error("💾 Modal content saved to data/modal_content.html")
-                    
-                except Exception as debug_e:
-                    logger.error(f"Modal debug info collection failed: {debug_e}")
+                # Verify it's the right input by checking attributes
+                attrs = await phone_input.evaluate(INPUT_ATTRIBUTES_JS)
                 
-                # Take screenshot for debugging
-                await page.screenshot(path='data/modal_debug.png')
-                logger.error("📸 Debug screenshot saved to data/modal_debug.png")
-                return False
+                logger.info("✅ Found phone input in modal")
+                logger.info(f"📝 Input details - ID: '{attrs['id']}', Placeholder: '{attrs['placeholder']}', Type: '{attrs['type']}', MaxLength: '{attrs['maxlength']}'")
+            except Exception as e:
+                logger.debug(f"⚠️ Phone input lookup failed: {e}")
+                phone_input = None
             
             if not phone_input:
                 logger.error("❌ Phone input field not found within modal")
@@ -948,19 +1466,21 @@ class GitHubActionsChecker:
                 # Enhanced debugging - check what's in the modal
                 try:
                     modal_content = await modal.inner_html()
-                    logger.error("� Modal content analysis:")
+                    logger.error("🔍 Modal content analysis:")
                     
-                    # Look for all inputs in modal
-                    modal_inputs = await modal.query_selector_all('input')
+                    # Look for all inputs in modal, reading their attributes in one call
+                    modal_inputs = await modal.eval_on_selector_all(
+                        'input', f"els => els.map({INPUT_ATTRIBUTES_JS})"
+                    )
                     logger.error(f"📝 Found {len(modal_inputs)} input elements in modal:")
                     
-                    for i, inp in enumerate(modal_inputs):
-                        input_type = await inp.get_attribute('type') or 'no-type'
-                        input_name = await inp.get_attribute('name') or 'no-name'
-                        input_id = await inp.get_attribute('id') or 'no-id'
-                        input_placeholder = await inp.get_attribute('placeholder') or 'no-placeholder'
-                        input_class = await inp.get_attribute('class') or 'no-class'
-                        logger.error(f"  Modal Input #{i+1}: type='{input_type}', name='{input_name}', id='{input_id}', placeholder='{input_placeholder}', class='{input_class}'")
+                    for i, attrs in enumerate(modal_inputs):
+                        logger.error(
+                            f"  Modal Input #{i+1}: type='{attrs['type'] or 'no-type'}', "
+                            f"name='{attrs['name'] or 'no-name'}', id='{attrs['id'] or 'no-id'}', "
+                            f"placeholder='{attrs['placeholder'] or 'no-placeholder'}', "
+                            f"class='{attrs['class'] or 'no-class'}'"
+                        )
                     
                     # Save modal content for analysis
                     with open('data/modal_content.html', 'w', encoding='utf-8') as f:
@@ -975,67 +1495,37 @@ class GitHubActionsChecker:
                 logger.error("📸 Debug screenshot saved to data/modal_debug.png")
                 return False
             
-            # Clear and fill the phone input
-            await phone_input.fill("")  # Clear by filling with empty string
+            # fill() focuses and replaces any existing content in one step
             # Remove +91 or other country codes as the site might add it automatically
             clean_phone = self.phone_number.replace('+91', '').replace('+', '').strip()
             await phone_input.fill(clean_phone)
             logger.info(f"📱 Phone number filled: {clean_phone}")
             
-            # Verify the phone number was actually filled
-            await asyncio.sleep(1)
+            # Verify the phone number was actually filled - fill() has already
+            # dispatched the input event, so no settle time is needed
             actual_value = await phone_input.input_value()
             if actual_value != clean_phone:
                 logger.warning(f"⚠️ Phone input verification failed. Expected: {clean_phone}, Actual: {actual_value}")
-                # Try filling again
+                # Only fall back to key-by-key typing when the instant fill was rejected
                 await phone_input.fill("")
-                await asyncio.sleep(0.5)
-                await phone_input.fill(clean_phone)
-                await asyncio.sleep(1)
+                await phone_input.press_sequentially(clean_phone, delay=50)
                 actual_value = await phone_input.input_value()
-                logger.info(f"📱 Phone number re-filled. Final value: {actual_value}")
+                logger.info(f"📱 Phone number re-typed. Final value: {actual_value}")
             
             # DEBUGGING: Take screenshot after phone filling to see current modal state
             await page.screenshot(path='data/debug_after_phone_fill.png')
             logger.info("📸 Debug: After phone number filling")
             
-            await asyncio.sleep(2)
-            
             # Find and click send OTP button within the modal
             logger.info("🔍 Looking for Send OTP button in modal...")
             
-            # Based on the HTML, the button has class="custom-button" and value="Send OTP"
-            modal_otp_selectors = [
-                '.modal-overlay .custom-button',  # The class that actually exists (from debug)
-                '.modal-overlay input[type="submit"]',  # Generic submit button in modal
-                '.modal-overlay input[value="Send OTP"]',  # Specific to the HTML structure
-                '.modal-content .custom-button',
-                '.modal-content input[type="submit"]',
-                '.contact-form input[type="submit"]',
-                '.contact-form .custom-button',
-                'form input[value="Send OTP"]',
-                'form .custom-button',
-                '.modal-overlay button',  # Fallback to any button in modal
-                '.modal-content button'   # Fallback to any button in modal content
-            ]
-            
-            otp_button = None
-            for selector in modal_otp_selectors:
-                try:
-                    # Use longer timeout for GitHub Actions environment
-                    selector_timeout = 10000 if is_github_actions else 5000
-                    otp_button = await page.wait_for_selector(selector, timeout=selector_timeout)
-                    if otp_button:
-                        # Check if button is visible and enabled
-                        is_visible = await otp_button.is_visible()
-                        is_enabled = await otp_button.is_enabled()
-                        if is_visible and is_enabled:
-                            logger.info(f"✅ Found OTP button: {selector}")
-                            break
-                        else:
-                            logger.info(f"⚠️ Found button but not usable: {selector} (visible: {is_visible}, enabled: {is_enabled})")
-                except Exception:
-                    continue
+            # Use longer timeout for GitHub Actions environment
+            selector_timeout = 10000 if is_github_actions else 5000
+            selector, otp_button = await self._first_matching(
+                page, self.SEND_OTP_SELECTORS, selector_timeout, require_enabled=True
+            )
+            if otp_button:
+                logger.info(f"✅ Found OTP button: {selector}")
             
             if not otp_button:
                 logger.error("❌ Send OTP button not found")
@@ -1056,9 +1546,6 @@ class GitHubActionsChecker:
                 await otp_button.click(timeout=10000)
                 logger.info("✅ Regular click completed")
                 
-                # Wait a bit and check for immediate feedback
-                await asyncio.sleep(2)
-                
             except Exception as regular_click_error:
                 logger.warning(f"⚠️ Regular click failed: {regular_click_error}")
                 
@@ -1067,7 +1554,6 @@ class GitHubActionsChecker:
                     logger.info("� Attempting JavaScript click...")
                     await otp_button.evaluate('element => element.click()')
                     logger.info("✅ JavaScript click completed")
-                    await asyncio.sleep(2)
                     
                 except Exception as js_click_error:
                     logger.warning(f"⚠️ JavaScript click failed: {js_click_error}")
@@ -1086,7 +1572,6 @@ class GitHubActionsChecker:
                             }
                         """)
                         logger.info(f"📋 Form submission result: {form_submit_result}")
-                        await asyncio.sleep(2)
                         
                     except Exception as form_submit_error:
                         logger.warning(f"⚠️ Form submission failed: {form_submit_error}")
@@ -1105,7 +1590,6 @@ class GitHubActionsChecker:
                                 }
                             """)
                             logger.info("✅ Event dispatch completed")
-                            await asyncio.sleep(2)
                             
                         except Exception as dispatch_error:
                             logger.error(f"❌ All click strategies failed. Last error: {dispatch_error}")
@@ -1119,39 +1603,19 @@ class GitHubActionsChecker:
             # Enhanced check for OTP request success with longer timeout for different environments
             logger.info("🔍 Checking for OTP request confirmation...")
             
-            # Strategy 1: Look for immediate UI changes (fast check)
+            # Strategies 1 and 2 race each other: a confirmation message or
+            # the OTP input appearing, whichever shows up first
             otp_sent = False
-            for indicator in ['text="OTP sent"', 'text="Code sent"', 'text="Sent"']:
-                try:
-                    element = await page.wait_for_selector(indicator, timeout=2000)
-                    if element:
-                        logger.info(f"✅ Found OTP confirmation: {indicator}")
-                        otp_sent = True
-                        break
-                except:
-                    continue
-            
-            if not otp_sent:
-                # Strategy 2: Check for OTP input fields appearing (medium check)
-                logger.info("🔍 Checking for OTP input field appearance...")
-                otp_input_selectors = [
-                    'input[placeholder*="OTP" i]',
-                    'input[placeholder*="code" i]',
-                    'input[placeholder*="verify" i]',
-                    'input[maxlength="4"]',
-                    'input[maxlength="6"]',
-                    '.otp-input'
-                ]
-                
-                for selector in otp_input_selectors:
-                    try:
-                        otp_input_field = await page.wait_for_selector(selector, timeout=3000)
-                        if otp_input_field and await otp_input_field.is_visible():
-                            logger.info(f"✅ OTP input field appeared: {selector}")
-                            otp_sent = True
-                            break
-                    except:
-                        continue
+            group, selector = await self._race_first_matching(page, {
+                'confirmation': self.OTP_SENT_SELECTORS,
+                'otp_input': self.OTP_APPEARED_SELECTORS,
+            }, 3000)
+            if group == 'confirmation':
+                logger.info(f"✅ Found OTP confirmation: {selector}")
+                otp_sent = True
+            elif group == 'otp_input':
+                logger.info(f"✅ OTP input field appeared: {selector}")
+                otp_sent = True
             
             if not otp_sent:
                 # Strategy 3: Check for network activity or form changes (slower check)
@@ -1201,12 +1665,23 @@ class GitHubActionsChecker:
             if is_github_actions:
                 otp_request_message += "\n\n🤖 _Running in GitHub Actions - please respond promptly_"
             
-            if not self.send_telegram_message(otp_request_message):
+            if not await self.send_telegram_message_async(otp_request_message):
                 logger.error("❌ Failed to send OTP request message")
                 return False
             
+            # Warm the browser cache with the venue pages while the user reads
+            # the OTP - the slot checks right after login then load faster
+            prefetch = asyncio.create_task(self._prefetch_academy_pages(page.context))
+            
             # Wait for OTP reply with environment-specific timeout
-            otp_code = await self.wait_for_otp_reply(timeout_minutes=timeout_minutes)
+            try:
+                otp_code = await self.wait_for_otp_reply(timeout_minutes=timeout_minutes)
+            finally:
+                # Never hold up the login for the prefetch, but let it close
+                # its tab before the login carries on in the same context
+                if not prefetch.done():
+                    prefetch.cancel()
+                await asyncio.gather(prefetch, return_exceptions=True)
             if not otp_code:
                 error_msg = (
                     f"⏰ *OTP Timeout*\n\n"
@@ -1217,39 +1692,15 @@ class GitHubActionsChecker:
                 if is_github_actions:
                     error_msg += "\n\n🤖 _GitHub Actions environment may require faster response times_"
                 
-                self.send_telegram_message(error_msg)
+                await self.send_telegram_message_async(error_msg)
                 return False
             
             # Find OTP input field and enter the code with better detection
             logger.info("🔍 Looking for OTP input field...")
-            otp_input_selectors = [
-                'input[name="otp"]',
-                'input[name="OTP"]',
-                'input[placeholder*="OTP" i]',
-                'input[placeholder*="code" i]',
-                'input[placeholder*="verify" i]',
-                'input[type="text"]:not([name="phone"]):not([name="mobile"])',
-                'input[type="number"]:not([name="phone"]):not([name="mobile"])',
-                'input.otp-input',
-                'input#otp',
-                'input[maxlength="6"]'
-            ]
-            
-            otp_input = None
             input_timeout = 8000 if is_github_actions else 3000
-            
-            for selector in otp_input_selectors:
-                try:
-                    otp_input = await page.wait_for_selector(selector, timeout=input_timeout)
-                    if otp_input:
-                        is_visible = await otp_input.is_visible()
-                        if is_visible:
-                            logger.info(f"✅ Found OTP input: {selector}")
-                            break
-                        else:
-                            logger.info(f"⚠️ Found hidden OTP input: {selector}")
-                except Exception:
-                    continue
+            selector, otp_input = await self._first_matching(page, self.OTP_INPUT_SELECTORS, input_timeout)
+            if otp_input:
+                logger.info(f"✅ Found OTP input: {selector}")
             
             if not otp_input:
                 logger.error("❌ OTP input field not found")
@@ -1260,40 +1711,15 @@ class GitHubActionsChecker:
             await otp_input.fill("")  # Clear any existing content
             await otp_input.fill(otp_code)
             logger.info(f"🔢 OTP entered: {otp_code}")
-            await asyncio.sleep(2)
             
             # Find and click login/verify button with better detection
             logger.info("🔍 Looking for verify/login button...")
-            login_selectors = [
-                'button:has-text("Verify")',
-                'button:has-text("VERIFY")',
-                'button:has-text("Login")',
-                'button:has-text("LOGIN")',
-                'button:has-text("Submit")',
-                'button:has-text("SUBMIT")',
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button.btn-verify',
-                'button.verify-btn',
-                '.btn-primary'
-            ]
-            
-            login_button = None
             button_timeout = 8000 if is_github_actions else 3000
-            
-            for selector in login_selectors:
-                try:
-                    login_button = await page.wait_for_selector(selector, timeout=button_timeout)
-                    if login_button:
-                        is_visible = await login_button.is_visible()
-                        is_enabled = await login_button.is_enabled()
-                        if is_visible and is_enabled:
-                            logger.info(f"✅ Found login button: {selector}")
-                            break
-                        else:
-                            logger.info(f"⚠️ Found unusable login button: {selector} (visible: {is_visible}, enabled: {is_enabled})")
-                except Exception:
-                    continue
+            selector, login_button = await self._first_matching(
+                page, self.VERIFY_BUTTON_SELECTORS, button_timeout, require_enabled=True
+            )
+            if login_button:
+                logger.info(f"✅ Found login button: {selector}")
             
             if not login_button:
                 logger.error("❌ Login button not found")
@@ -1319,9 +1745,20 @@ class GitHubActionsChecker:
             
             logger.info("🚀 Login submitted")
             
-            # Wait longer for login processing in GitHub Actions
+            # Proceed as soon as the login modal closes or the token is
+            # stored, whichever happens first, allowing longer for login
+            # processing in GitHub Actions
             processing_wait = 12 if is_github_actions else 8
-            await asyncio.sleep(processing_wait)
+            signal = await self._first_signal({
+                'login modal closed': page.wait_for_selector(
+                    '.modal-overlay', state='hidden', timeout=processing_wait * 1000),
+                'loginToken stored': page.wait_for_function(
+                    LOGIN_TOKEN_SET_JS, timeout=processing_wait * 1000),
+            })
+            if signal:
+                logger.info(f"✅ Login processed ({signal})")
+            else:
+                logger.warning(f"⚠️ Login modal still open after {processing_wait}s")
             
             # Check if login was successful
             logger.info(f"🔍 Current URL after login: {page.url}")
@@ -1342,7 +1779,7 @@ class GitHubActionsChecker:
                     "Continuing with slot checking...\n\n"
                     "🏸 I'll check for available slots now!"
                 )
-                self.send_telegram_message(success_msg)
+                await self.send_telegram_message_async(success_msg)
                 
                 return True
             else:
@@ -1354,7 +1791,7 @@ class GitHubActionsChecker:
                     "I'll try again in the next hour.\n\n"
                     "Make sure to reply quickly with the correct OTP next time."
                 )
-                self.send_telegram_message(fail_msg)
+                await self.send_telegram_message_async(fail_msg)
                 return False
                 
         except Exception as e:
@@ -1364,104 +1801,294 @@ class GitHubActionsChecker:
                 f"An error occurred during login: {str(e)}\n\n"
                 "I'll try again in the next hour."
             )
-            self.send_telegram_message(error_msg)
+            await self.send_telegram_message_async(error_msg)
             return False
     
     async def check_academy_slots(self, page, academy, dates):
-        """Check slots for one academy"""
+        """
+        Check slots for one academy, with each date on its own page
+
+        This is an async generator: each available slot is yielded as soon
+        as its court has been read, while the other dates are still loading.
+        """
         logger.info(f"🏸 Checking: {academy['name']}")
-        all_slots = []
         
         try:
-            # Navigate to academy page
-            await page.goto(academy['url'], wait_until='domcontentloaded', timeout=20000)
-            await asyncio.sleep(4)
+            # Navigate to academy page - the date picker wait below is what matters
+            await page.goto(academy['url'], wait_until='commit', timeout=20000)
+            await self._wait_for_booking_page(page)
             
             # Check if we got redirected to login
             if 'login' in page.url.lower():
                 logger.error("❌ Redirected to login - session expired")
-                return []
-            
+                return
+        except Exception as e:
+            logger.error(f"❌ Academy check failed: {e}")
+            return
+        
+        # Date checks push slots into the queue, None marks the end
+        queue = asyncio.Queue()
+        producer = asyncio.create_task(self._check_dates(page, academy, dates, queue))
+        try:
+            while (slot := await queue.get()) is not None:
+                yield slot
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+    
+    async def _collect_academy_slots(self, page, academy, dates, own_page=False):
+        """Collect one academy's slots, optionally on a new tab of page's context"""
+        if own_page:
+            page = await page.context.new_page()
+        try:
+            slots = [slot async for slot in self.check_academy_slots(page, academy, dates)]
+        finally:
+            if own_page:
+                await page.close()
+        
+        if slots:
+            logger.info("✅ %s: %d slots found", academy['short'], len(slots))
+        else:
+            logger.info("😔 %s: No slots available", academy['short'])
+        return slots
+    
+    async def _check_dates(self, page, academy, dates, queue):
+        """Run the date checks for one academy, feeding found slots into queue"""
+        try:
+            # The first date reuses the already loaded page, the rest open
+            # extra tabs in the same (logged in) context
+            await asyncio.gather(*[
+                self._check_date_bounded(page, academy, date, queue, reuse_page=(i == 0))
+                for i, date in enumerate(dates)
+            ])
+        except Exception as e:
+            logger.error(f"❌ Academy check failed: {e}")
+        finally:
+            queue.put_nowait(None)
+    
+    async def _check_date_bounded(self, page, academy, date, queue, reuse_page):
+        """Check one date once a page slot is free (at most MAX_PARALLEL_PAGES at a time)"""
+        async with self._page_semaphore:
+            if reuse_page:
+                return await self._check_date(page, academy, date, queue)
+            return await self._check_date_in_new_page(page.context, academy, date, queue)
+    
+    async def _check_date_in_new_page(self, context, academy, date, queue=None):
+        """Open the academy in a new tab, check one date and close the tab"""
+        page = await context.new_page()
+        try:
+            await page.goto(academy['url'], wait_until='commit', timeout=20000)
+            await self._wait_for_booking_page(page)
+            return await self._check_date(page, academy, date, queue)
+        except Exception as e:
+            logger.error(f"      Error checking date {date}: {e}")
+            return []
+        finally:
+            await page.close()
+    
+    async def _qs(self, page, selector):
+        """query_selector that reuses a live handle until the page navigates"""
+        page_cache = self._elem_cache.get(id(page))
+        if page_cache is None:
+            page_cache = self._elem_cache[id(page)] = {}
+            page.on('framenavigated',
+                    lambda frame: frame == page.main_frame and page_cache.clear())
+            page.on('close', lambda _: self._elem_cache.pop(id(page), None))
+        
+        handle = page_cache.get(selector)
+        if handle:
+            try:
+                if await handle.evaluate('e => e.isConnected'):
+                    return handle
+            except Exception:
+                pass
+        
+        handle = await page.query_selector(selector)
+        if handle:
+            page_cache[selector] = handle
+        else:
+            page_cache.pop(selector, None)
+        return handle
+    
+    async def _wait_for_booking_page(self, page):
+        """Wait until the SPA renders the date picker (or gives up and redirects)"""
+        try:
+            await page.wait_for_selector(DATE_INPUT_SELECTOR, timeout=15000)
+        except Exception:
+            logger.debug("Date input did not appear after navigation")
+    
+    async def _calendar_availability(self, response):
+        """Free slot times per court number from a captured Calender API response, or None"""
+        try:
+            result = loads_json(await response.body()).get('Result')
+        except (PlaywrightError, ValueError, AttributeError):
+            return None
+        if not isinstance(result, dict):
+            return None
+        availability = {}
+        for court_id, court in result.items():
+            # Entries look like "12:00-13:00|1|405": time|1=available|price
+            parts = (entry.split('|') for entry in court.get('court_available_slots', ())
+                     if isinstance(entry, str))
+            availability[court_number(court.get('court_name', court_id))] = frozenset(
+                normalize_slot_time(p[0]) for p in parts if len(p) >= 3 and p[1] == '1'
+            )
+        return availability
+    
+    async def _read_court_slots(self, page, court_item, expected, shown):
+        """
+        Select one court and return its free slots, or None if they can't be trusted
+
+        expected is the court's set of free times from the calendar response,
+        shown the same for the court the page displays now (None = unknown).
+        The slots are read once the click demonstrably took effect: an API
+        response it triggered has been rendered, or the slot list changed.
+        If neither happens, the list may still be the previous court's, and
+        it is only used when the calendar response confirms it.
+        """
+        # Identical availability - the slots on screen are already this court's
+        if expected is not None and expected == shown:
+            return [slot for slot in loads_json(await page.evaluate(TIME_SLOTS_JS)) if not slot['b']]
+        
+        previous = await page.evaluate(SLOT_SIGNATURE_JS)
+        await court_item.click()
+        signal = await self._first_signal({
+            'response': page.wait_for_event(
+                'response', predicate=lambda r: r.url.startswith(BOOKING_API_BASE), timeout=5000
+            ),
+            'changed': page.wait_for_function(SLOTS_CHANGED_JS, arg=previous, timeout=5000),
+        })
+        if signal == 'response':
+            await page.evaluate(NEXT_PAINT_JS)
+        
+        free_slots = [slot for slot in loads_json(await page.evaluate(TIME_SLOTS_JS)) if not slot['b']]
+        if signal is None and (
+                expected is None or expected != {normalize_slot_time(slot['t']) for slot in free_slots}):
+            return None
+        return free_slots
+    
+    async def _check_date(self, page, academy, date, queue=None):
+        """
+        Check every court for one date on an academy page already loaded in page
+
+        Returns the available slots; each is also put on queue when given.
+        """
+        logger.info("   📅 Checking %s", date)
+        date_slots = []
+        # Per-court lines are buffered and logged as one record per date,
+        # so dates checked on parallel tabs do not interleave
+        court_lines = []
+        
+        try:
             # Look for date input
-            date_input = await page.query_selector('input#card1[type="date"]')
+            date_input = await self._qs(page, DATE_INPUT_SELECTOR)
             if not date_input:
                 logger.error("❌ Date input not found")
                 return []
             
-            # Check each date
-            for date in dates:
-                logger.info(f"   📅 Checking {date}")
-                
-                try:
-                    # Set date
-                    await date_input.click()
+            court_items = page.locator(COURT_SELECTOR)
+            
+            # Set date and wait for the calendar request it triggers. Its
+            # per-court availability settles court reads the DOM can't tell
+            # apart (see _read_court_slots).
+            await date_input.click()
+            calendar = None
+            try:
+                async with page.expect_response(lambda r: '/Get/Calender' in r.url, timeout=15000) as response_info:
                     await date_input.fill('')
                     await date_input.fill(date)
                     await date_input.dispatch_event('change')
-                    await asyncio.sleep(6)  # Wait for courts to load
-                    
-                    # Get courts
-                    courts = await page.query_selector_all('div.court-item')
-                    if not courts:
-                        logger.info(f"      No courts available for {date}")
+                calendar = await self._calendar_availability(await response_info.value)
+            except Exception:
+                logger.debug("No calendar response seen for %s", date)
+            
+            # Then for the courts to render. The court list is the same for
+            # every date, so once it is known only its size has to match.
+            court_names = self._court_names.get(academy['short'])
+            if court_names:
+                try:
+                    await page.wait_for_function(COURT_COUNT_JS, arg=len(court_names), timeout=5000)
+                except Exception:
+                    court_names = None
+            if not court_names:
+                try:
+                    await page.wait_for_function(COURTS_RENDERED_JS, timeout=5000)
+                except Exception:
+                    pass
+                court_names = loads_json(await page.evaluate(COURT_NAMES_JS))
+                if court_names:
+                    self._court_names[academy['short']] = court_names
+            
+            if not court_names:
+                logger.info("      No courts available for %s", date)
+                return []
+            
+            court_lines.append("      Found %d courts for %s" % (len(court_names), date))
+            
+            # Loop invariants, bound once rather than per slot
+            academy_short = academy['short']
+            academy_full = academy['name']
+            evaluate = page.evaluate
+            
+            # Let the new date's render commit, so the first court's "slot
+            # list changed" signal comes from its click and not from that
+            await evaluate(NEXT_PAINT_JS)
+            
+            # Free times of the court whose slots the page currently shows,
+            # when known from the calendar response
+            shown = None
+            
+            # Check each court
+            for court_index, court_name in enumerate(court_names):
+                try:
+                    expected = calendar.get(court_number(court_name)) if calendar else None
+                    free_slots = await self._read_court_slots(
+                        page, court_items.nth(court_index), expected, shown
+                    )
+                    shown = expected
+                    if free_slots is None:
+                        shown = None
+                        court_lines.append("         ⚠️ %s (%s): slots not confirmed - skipped" % (court_name, date))
                         continue
                     
-                    logger.info(f"      Found {len(courts)} courts")
+                    court_slots = [
+                        {
+                            'academy': academy_short,
+                            'academy_full': academy_full,
+                            'date': date,
+                            'court': court_name,
+                            'time': slot['t'],
+                            'status': 'available'
+                        }
+                        for slot in free_slots
+                    ]
+                    date_slots.extend(court_slots)
+                    if queue is not None:
+                        for slot_info in court_slots:
+                            queue.put_nowait(slot_info)
                     
-                    # Check each court
-                    for court in courts:
-                        try:
-                            court_name = await court.inner_text()
-                            await court.click()
-                            await asyncio.sleep(3)
-                            
-                            # Get time slots
-                            time_slots = await page.query_selector_all('span.styled-btn')
-                            available_count = 0
-                            
-                            for slot in time_slots:
-                                try:
-                                    time_text = await slot.inner_text()
-                                    style = await slot.get_attribute('style') or ''
-                                    
-                                    # Check if slot is available (not red/disabled)
-                                    is_booked = ('color: red' in style.lower() and 
-                                               'cursor: not-allowed' in style.lower())
-                                    
-                                    if not is_booked:
-                                        available_count += 1
-                                        slot_info = {
-                                            'academy': academy['short'],
-                                            'academy_full': academy['name'],
-                                            'date': date,
-                                            'court': court_name,
-                                            'time': time_text,
-                                            'status': 'available'
-                                        }
-                                        all_slots.append(slot_info)
-                                
-                                except Exception:
-                                    continue
-                            
-                            if available_count > 0:
-                                logger.info(f"         ✅ {court_name}: {available_count} slots available")
-                        
-                        except Exception:
-                            continue
+                    available_count = len(court_slots)
+                    if available_count > 0:
+                        court_lines.append("         ✅ %s (%s): %d slots available" % (court_name, date, available_count))
                 
-                except Exception as e:
-                    logger.error(f"      Error checking date {date}: {e}")
+                except Exception:
                     continue
-        
+            
         except Exception as e:
-            logger.error(f"❌ Academy check failed: {e}")
+            logger.error(f"      Error checking date {date}: {e}")
         
-        return all_slots
+        finally:
+            # Whatever was found before an error is still logged
+            if court_lines:
+                logger.info("\n".join(court_lines))
+        
+        return date_slots
     
     def format_results_message(self, all_slots, dates):
         """Format results for Telegram with table format"""
         if not all_slots:
-            date_strs = [datetime.strptime(d, '%Y-%m-%d').strftime('%A %b %d') for d in dates]
+            date_strs = [format_date(d, '%A %b %d') for d in dates]
             return (
                 f"🏸 *Badminton Checker Update*\n\n"
                 f"😔 No slots available\n\n"
@@ -1471,13 +2098,14 @@ class GitHubActionsChecker:
                 f"All courts are currently booked."
             )
         
-        # Group results by date
-        slots_by_date = {}
+        # Single pass: (date, academy) -> {(court_number, time)} for O(1) cell lookups
+        available = defaultdict(set)
         for slot in all_slots:
-            date = slot['date']
-            if date not in slots_by_date:
-                slots_by_date[date] = []
-            slots_by_date[date].append(slot)
+            # Same court parsing as the dedup keys ("Court 1" or "1" -> "1")
+            number = court_number(slot['court'])
+            if number.isdigit():
+                available[(slot['date'], slot['academy'])].add((int(number), slot['time'].strip()))
+        dates_with_slots = {slot['date'] for slot in all_slots}
         
         # Determine if we have any slots at all
         has_any_slots = len(all_slots) > 0
@@ -1491,27 +2119,15 @@ class GitHubActionsChecker:
             message += f"😔 No slots available\n\n"
         
         # Check each date (both those with and without slots)
-        for date in sorted(dates):
-            date_obj = datetime.strptime(date, '%Y-%m-%d')
-            formatted_date = date_obj.strftime('%A, %B %d')
+        for check_date in sorted(dates):
+            formatted_date = format_date(check_date, '%A, %B %d')
             message += f"📅 *{formatted_date}*\n\n"
             
-            if date in slots_by_date:
+            if check_date in dates_with_slots:
                 # This date has slots - create tables for each academy
-                slots = slots_by_date[date]
-                
-                # Group by academy
-                by_academy = {}
-                for slot in slots:
-                    academy = slot['academy']
-                    if academy not in by_academy:
-                        by_academy[academy] = []
-                    by_academy[academy].append(slot)
-                
-                # Create table for each academy
                 for academy_short in ['Kotak', 'Pullela', 'SAI']:  # Process in this order
-                    if academy_short in by_academy:
-                        message += self.create_academy_table(academy_short, by_academy[academy_short])
+                    if (check_date, academy_short) in available:
+                        message += self.create_academy_table(academy_short, available[(check_date, academy_short)])
                         message += "\n"
             else:
                 # This date has no slots
@@ -1522,65 +2138,124 @@ class GitHubActionsChecker:
         
         return message
     
-    def create_academy_table(self, academy_short, academy_slots):
-        """Create a compact table format for an academy's available slots"""
-        # Define academy-specific configurations based on actual data patterns
-        academy_configs = {
-            'Kotak': {
-                'courts': list(range(1, 7)),  # Courts 1-6
-                'time_slots': ['12:00-13:00', '13:00-14:00', '18:00-19:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'],
-                'time_labels': ['12h', '13h', '18h', '19h', '20h', '21h']  # Compact labels
-            },
-            'Pullela': {
-                'courts': list(range(1, 9)),  # Courts 1-8 
-                'time_slots': ['12:00-13:00', '13:00-14:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'],
-                'time_labels': ['12h', '13h', '19h', '20h', '21h']
-            },
-            'SAI': {
-                'courts': list(range(1, 10)),  # Courts 1-9
-                'time_slots': ['12:00-13:00', '13:00-14:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'],
-                'time_labels': ['12h', '13h', '19h', '20h', '21h']
-            }
-        }
-        
-        config = academy_configs.get(academy_short, {})
-        courts = config.get('courts', [])
-        time_slots = config.get('time_slots', [])
-        time_labels = config.get('time_labels', [])
-        
-        # Create set of available court-time combinations
-        available_slots = set()
-        for slot in academy_slots:
-            court_num = slot['court'].strip()
-            time = slot['time'].strip()
-            # Extract just the number from court (in case it's "Court 1" or "1")
-            court_number = ''.join(filter(str.isdigit, court_num))
-            if court_number:
-                available_slots.add((int(court_number), time))
+    def create_academy_table(self, academy_short, available_slots):
+        """
+        Create a compact table format for an academy's available slots
+
+        available_slots is the set of (court_number, time) pairs built by
+        format_results_message.
+        """
+        courts, time_slots, time_labels = self.ACADEMY_TABLE_LAYOUTS.get(academy_short, ((), (), ()))
         
-        # Build compact table using shorter format
-        table_text = f"🏟️ *{academy_short}*\n"
+        # Build compact table using shorter format, one line per list entry
+        # so the text is joined once instead of re-copied per cell
+        lines = [f"🏟️ *{academy_short}*"]
         
-        # Use a more compact format with fixed-width cells
-        table_text += "`C "  # Court column header (shortened)
-        for label in time_labels:
-            table_text += f"{label:>4}"  # 4 characters per time slot
-        table_text += "`\n"
+        # Use a more compact format with fixed-width cells (4 characters per time slot)
+        lines.append("`C " + "".join(f"{label:>4}" for label in time_labels) + "`")
         
         # Separator line
-        table_text += "`" + "-" * (2 + len(time_labels) * 4) + "`\n"
+        lines.append("`" + "-" * (2 + len(time_labels) * 4) + "`")
         
         # Rows for each court (more compact)
+        available, booked = f"{'✓':>4}", f"{'✗':>4}"
         for court in courts:
-            table_text += f"`{court} "
-            for i, time_slot in enumerate(time_slots):
-                if (court, time_slot) in available_slots:
-                    table_text += f"{'✓':>4}"  # Available
-                else:
-                    table_text += f"{'✗':>4}"  # Not available
-            table_text += "`\n"
+            cells = "".join(
+                available if (court, time_slot) in available_slots else booked
+                for time_slot in time_slots
+            )
+            lines.append(f"`{court} {cells}`")
         
-        return table_text
+        return "\n".join(lines) + "\n"
+    
+    async def open_browser(self, p):
+        """
+        Connect to the Chrome at CDP_ENDPOINT if set, otherwise launch Chromium
+
+        Returns (browser, context). Over CDP the browser's default context is
+        reused so its cookies and storage carry over between runs. With
+        BROWSER_PROFILE_DIR set, a persistent context is launched on that
+        profile instead and browser is None. Otherwise the context is a
+        fresh one on the process-wide shared browser, and browser is None
+        too - only the context belongs to this run.
+        """
+        if self.cdp_endpoint:
+            try:
+                browser = await p.chromium.connect_over_cdp(self.cdp_endpoint)
+                logger.info(f"🔌 Connected to running Chrome at {self.cdp_endpoint}")
+                if browser.contexts:
+                    return browser, browser.contexts[0]
+                return browser, await browser.new_context(
+                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                    viewport={'width': 1280, 'height': 720}
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Could not connect to {self.cdp_endpoint}: {e} - launching Chromium instead")
+        
+        if self.profile_dir:
+            profile_path = Path(self.profile_dir)
+            self.profile_reused = profile_path.exists() and any(profile_path.iterdir())
+            logger.info(f"🗂️ Using browser profile {profile_path} "
+                        f"({'existing' if self.profile_reused else 'new'})")
+            context = await p.chromium.launch_persistent_context(
+                user_data_dir=str(profile_path),
+                headless=True,
+                args=LAUNCH_ARGS,
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                viewport={'width': 1280, 'height': 720}
+            )
+            return None, context
+        
+        context_options = {
+            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'viewport': {'width': 1280, 'height': 720}
+        }
+        launch_options = {'headless': True, 'args': LAUNCH_ARGS}
+        
+        # Start from the saved storage state so the login usually survives
+        if self.storage_state_file.exists() and not self.force_fresh_login:
+            try:
+                context = await new_context(
+                    launch_options=launch_options,
+                    storage_state=str(self.storage_state_file),
+                    **context_options
+                )
+                self.storage_state_loaded = True
+                logger.info(f"🔑 Loaded browser storage state from {self.storage_state_file}")
+                return None, context
+            except Exception as e:
+                logger.warning(f"⚠️ Could not load storage state, starting clean: {e}")
+        
+        context = await new_context(launch_options=launch_options, **context_options)
+        return None, context
+    
+    async def _ensure_browser(self):
+        """Open the browser and context on first use and return the cached pair"""
+        if self._context is None:
+            p = await get_playwright()
+            self._browser, self._context = await self.open_browser(p)
+            
+            # Skip images/fonts/media to cut bytes per navigation
+            await self._context.route("**/*", block_heavy_resources)
+            
+            # Set longer default timeouts
+            self._context.set_default_timeout(60000)  # 60 seconds
+            self._context.set_default_navigation_timeout(60000)  # 60 seconds
+        return self._browser, self._context
+    
+    async def aclose(self):
+        """Close the context (or disconnect from CDP) opened by _ensure_browser"""
+        browser, context = self._browser, self._context
+        self._browser = self._context = None
+        try:
+            # Over CDP this only disconnects - the shared Chrome keeps running.
+            # A pooled browser stays up for the rest of the process.
+            if browser:
+                await browser.close()
+            elif context:
+                await context.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser context: {e}")
     
     async def run_check(self):
         """Main checking logic with hybrid API/browser approach"""
@@ -1590,7 +2265,6 @@ class GitHubActionsChecker:
         is_github_actions = os.getenv('GITHUB_ACTIONS') == 'true'
         logger.info(f"🔍 Environment: {'GitHub Actions' if is_github_actions else 'Local'}")
         logger.info(f"📁 Data directory: {self.data_dir}")
-        logger.info(f"🍪 Cookies file: {self.cookies_file}")
         logger.info(f"📄 Session file: {self.session_file}")
         
         # Check if data directory exists and list contents
@@ -1601,7 +2275,7 @@ class GitHubActionsChecker:
             logger.info("📂 Data directory does not exist")
         
         dates = self.get_check_dates()
-        date_strs = [datetime.strptime(d, '%Y-%m-%d').strftime('%A %b %d') for d in dates]
+        date_strs = [format_date(d, '%A %b %d') for d in dates]
         logger.info(f"📅 Checking dates: {' & '.join(date_strs)}")
         
         # HYBRID APPROACH: Try API first if available
@@ -1621,12 +2295,25 @@ class GitHubActionsChecker:
                 if api_results and any(results for results in api_results.values()):
                     # API approach successful!
                     message = api_checker.format_results_for_telegram(api_results)
-                    self.send_telegram_message(message)
+                    slot_keys = [
+                        seen_slot_key(
+                            api_checker.ACADEMY_SHORT_NAMES.get(academy_name, academy_name),
+                            slot['date'], slot['court_name'], time_slot
+                        )
+                        for academy_name, academy_slots in api_results.items()
+                        for slot in academy_slots
+                        for time_slot, info in slot.get('all_time_slots', {}).items()
+                        if info['available']
+                    ]
+                    await self.send_results_message_async(message, slot_keys)
                     
                     # Count total slots for logging
-                    total_api_slots = 0
-                    for academy_slots in api_results.values():
-                        total_api_slots += sum(slot['available_slots'] for slot in academy_slots if slot['available'])
+                    total_api_slots = sum(
+                        slot['available_slots']
+                        for academy_slots in api_results.values()
+                        for slot in academy_slots
+                        if slot['available']
+                    )
                     
                     logger.info(f"🎯 Total slots found via API: {total_api_slots}")
                     logger.info("✅ API-based check completed successfully - no browser automation needed!")
@@ -1642,109 +2329,113 @@ class GitHubActionsChecker:
         # BROWSER AUTOMATION FALLBACK
         logger.info("🌐 Using browser automation approach...")
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-timeout',
-                    '--disable-dev-shm-usage'
-                ]
-            )
+        # Session files and debug screenshots/HTML dumps all go here
+        self.data_dir.mkdir(exist_ok=True)
+        
+        browser, context = await self._ensure_browser()
+        
+        # A persistent profile context starts with a blank tab - use it
+        # rather than opening a second one (CDP tabs belong to the user)
+        if browser is None and context.pages:
+            page = context.pages[0]
+        else:
+            page = await context.new_page()
+        
+        try:
+            # Try to restore session unless forced fresh login
+            session_restored = False
+            if (self.profile_reused or self.storage_state_loaded) and not self.force_fresh_login:
+                # Cookies and localStorage already live in the browser profile
+                # or were loaded with the context - only sessionStorage is
+                # seeded from the session file before the page opens
+                source = "browser profile" if self.profile_reused else "storage state"
+                logger.info(f"🗂️ Using {source} - skipping session file restore")
+                session_restored = await self._open_start_page(page)
+            elif not self.force_fresh_login:
+                logger.info("🔄 Attempting to restore existing session...")
+                session_restored = await self.restore_session_with_retry(page)
+            else:
+                logger.info("🔄 Force fresh login enabled - skipping session restore")
+            
+            # Verify login with retry logic
+            logged_in = False
+            if session_restored:
+                logger.info("✅ Session restored, now verifying login...")
+                logged_in = await self.verify_login_with_retry(page)
+                if logged_in:
+                    logger.info("🎉 Session successfully restored and verified!")
+                else:
+                    logger.warning("❌ Session restored but login verification failed - will need fresh login")
+            else:
+                logger.info("❌ Session restore failed or skipped")
             
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                viewport={'width': 1280, 'height': 720}
+            if not logged_in:
+                logger.warning("🔐 Not logged in - attempting interactive login")
+                
+                # Try interactive login
+                login_success = await self.interactive_login(page)
+                if not login_success:
+                    logger.error("❌ Interactive login failed")
+                    return
+                
+                logger.info("✅ Interactive login successful, proceeding...")
+            else:
+                logger.info("✅ Already logged in, proceeding with checks...")
+            
+            # Check all academies at once - the first reuses the logged in
+            # page, the others get their own tab in the same context
+            academy_results = await asyncio.gather(*[
+                self._collect_academy_slots(page, academy, dates, own_page=(i > 0))
+                for i, academy in enumerate(self.academies)
+            ])
+            all_available_slots = [slot for slots in academy_results for slot in slots]
+            
+            # Save session for next run while the results go out
+            logger.info("💾 Attempting to save session for next run...")
+            message = self.format_results_message(all_available_slots, dates)
+            slot_keys = [
+                seen_slot_key(slot['academy'], slot['date'], slot['court'], slot['time'])
+                for slot in all_available_slots
+            ]
+            save_success, _ = await asyncio.gather(
+                self.save_session(page),
+                self.send_results_message_async(message, slot_keys)
             )
+            if save_success:
+                logger.info("✅ Session saved successfully for next run!")
+            else:
+                logger.error("❌ Failed to save session - next run will require fresh login")
             
-            # Set longer default timeouts
-            context.set_default_timeout(60000)  # 60 seconds
-            context.set_default_navigation_timeout(60000)  # 60 seconds
+            logger.info(f"🎯 Total slots found: {len(all_available_slots)}")
+            logger.info("✅ Browser-based check completed successfully")
             
-            page = await context.new_page()
+        except Exception as e:
+            logger.error(f"❌ Check failed: {e}")
+            await self.send_telegram_message_async(
+                f"❌ *Badminton Checker Error*\n\n"
+                f"Error: `{str(e)[:100]}`\n\n"
+                f"Will try again in the next hour."
+            )
             
-            try:
-                # Try to restore session unless forced fresh login
-                session_restored = False
-                if not self.force_fresh_login:
-                    logger.info("🔄 Attempting to restore existing session...")
-                    session_restored = await self.restore_session_with_retry(page)
-                else:
-                    logger.info("🔄 Force fresh login enabled - skipping session restore")
-                
-                # Verify login with retry logic
-                logged_in = False
-                if session_restored:
-                    logger.info("✅ Session restored, now verifying login...")
-                    logged_in = await self.verify_login_with_retry(page)
-                    if logged_in:
-                        logger.info("🎉 Session successfully restored and verified!")
-                    else:
-                        logger.warning("❌ Session restored but login verification failed - will need fresh login")
-                else:
-                    logger.info("❌ Session restore failed or skipped")
-                
-                if not logged_in:
-                    logger.warning("🔐 Not logged in - attempting interactive login")
-                    
-                    # Try interactive login
-                    login_success = await self.interactive_login(page)
-                    if not login_success:
-                        logger.error("❌ Interactive login failed")
-                        return
-                    
-                    logger.info("✅ Interactive login successful, proceeding...")
-                else:
-                    logger.info("✅ Already logged in, proceeding with checks...")
-                
-                # Check all academies
-                all_available_slots = []
-                for academy in self.academies:
-                    slots = await self.check_academy_slots(page, academy, dates)
-                    all_available_slots.extend(slots)
-                    
-                    if slots:
-                        logger.info(f"✅ {academy['short']}: {len(slots)} slots found")
-                    else:
-                        logger.info(f"😔 {academy['short']}: No slots available")
-                
-                # Save session for next run
-                logger.info("💾 Attempting to save session for next run...")
-                save_success = await self.save_session(page)
-                if save_success:
-                    logger.info("✅ Session saved successfully for next run!")
-                else:
-                    logger.error("❌ Failed to save session - next run will require fresh login")
-                
-                # Send results
-                message = self.format_results_message(all_available_slots, dates)
-                self.send_telegram_message(message)
-                
-                logger.info(f"🎯 Total slots found: {len(all_available_slots)}")
-                logger.info("✅ Browser-based check completed successfully")
-                
-            except Exception as e:
-                logger.error(f"❌ Check failed: {e}")
-                self.send_telegram_message(
-                    f"❌ *Badminton Checker Error*\n\n"
-                    f"Error: `{str(e)[:100]}`\n\n"
-                    f"Will try again in the next hour."
-                )
-                
-            finally:
-                await browser.close()
+        finally:
+            # Only the page goes - the context is reused until aclose()
+            await page.close()
 
 async def main():
     """Main entry point"""
+    checker = None
     try:
         checker = GitHubActionsChecker()
         await checker.run_check()
     except Exception as e:
         logger.error(f"❌ Startup failed: {e}")
-        print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if checker:
+            await checker.aclose()
+        await close_browser_pool()
+        close_telegram_session()
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
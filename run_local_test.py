@@ -9,8 +9,7 @@ from pathlib import Path
 import asyncio
 import logging
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from src.checker_helpers import load_env_file as load_env_values, install_uvloop, close_telegram_session
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -27,40 +26,13 @@ def load_env_file():
     
     logger.info("📁 Loading environment variables from .env file...")
     
-    try:
-        with open(env_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse KEY=VALUE format
-                if '=' not in line:
-                    logger.warning(f"⚠️ Invalid format on line {line_num}: {line}")
-                    continue
-                
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                # Set environment variable
-                os.environ[key] = value
-                logger.debug(f"✅ Set {key}={value[:10]}...")
-        
-        logger.info("✅ Environment variables loaded successfully")
-        return True
-        
-    except Exception as e:
-        logger.error(f"❌ Failed to load .env file: {e}")
+    # Values from .env take priority over the shell for local testing
+    if not load_env_values(override=True):
+        logger.error("❌ Failed to load .env file")
         return False
+    
+    logger.info("✅ Environment variables loaded successfully")
+    return True
 
 def verify_credentials():
     """Verify that required credentials are available"""
@@ -88,6 +60,7 @@ def verify_credentials():
 
 async def run_local_test():
     """Run the main checker script locally"""
+    checker = None
     try:
         # Import the main checker
         from github_actions_checker import GitHubActionsChecker
@@ -105,11 +78,17 @@ async def run_local_test():
     except Exception as e:
         logger.error(f"❌ Local test failed: {e}")
         raise
+    finally:
+        if checker:
+            await checker.aclose()
+        from src.browser_pool import close_browser_pool
+        await close_browser_pool()
+        close_telegram_session()
 
 def main():
     """Main function for local testing"""
-    print("🏸 Badminton Checker - Local Test")
-    print("=" * 50)
+    logger.info("🏸 Badminton Checker - Local Test")
+    logger.info("=" * 50)
     
     # Load environment variables from .env file
     if not load_env_file():
@@ -142,11 +121,11 @@ def main():
         logger.info("   🐛 Debug mode: ENABLED (extra logging)")
         logging.getLogger().setLevel(logging.DEBUG)
     
-    print("")
     logger.info("🚀 Starting test run...")
     
     try:
         # Run the async test
+        install_uvloop()
         asyncio.run(run_local_test())
         return 0
         
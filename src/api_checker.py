@@ -4,21 +4,104 @@ Provides a more reliable alternative to browser automation
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import logging
+import re
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Any
 import asyncio
+import heapq
 import os
+import time
+from collections import defaultdict
+
+from src.checker_helpers import age_seconds, format_date, loads_json, read_json, write_json
 
 logger = logging.getLogger(__name__)
 
+# urllib3 only decodes Brotli bodies when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+
+def _time_sort_key(time_slot):
+    """Sort key for "12:00-13:00" style slots: the start time as HHMM"""
+    try:
+        hour, _, minute = time_slot.partition('-')[0].partition(':')
+        return int(hour) * 100 + int(minute)
+    except (AttributeError, ValueError):
+        return 9999
+
 class BadmintonAPIChecker:
     """
     Token-based API client for badminton booking system
     Uses authentication tokens instead of browser automation
     """
     
+    # Words on the main page that suggest a logged-in session
+    LOGGED_IN_INDICATORS = (
+        'logout', 'profile', 'dashboard', 'booking', 'user',
+        'login-token', 'logintoken'
+    )
+    
+    # Response keys that may hold slot data, and the per-item field names
+    # tried (in order) for the court name, free slots and total slots
+    SLOT_DATA_KEYS = ('slots', 'courts', 'bookings', 'availability', 'data', 'results')
+    NAME_FIELDS = ('name', 'court_name', 'title', 'court', 'venue')
+    AVAILABILITY_FIELDS = ('available', 'availability', 'slots_available', 'free_slots')
+    TOTAL_FIELDS = ('total', 'total_slots', 'capacity', 'max_slots')
+    
+    # Patterns for court names and free-slot counts when the API answers
+    # with HTML instead of JSON, compiled once
+    COURT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'court["\s]*:[\s]*["\']([^"\']+)["\']',
+        r'court["\s]*["\']([^"\']+)["\']',
+        r'name["\s]*:[\s]*["\']([^"\']+)["\'].*court',
+    ))
+    AVAILABILITY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'available["\s]*:[\s]*(\d+)',
+        r'slots["\s]*:[\s]*(\d+)',
+        r'free["\s]*:[\s]*(\d+)',
+    ))
+    
+    # Browser-like headers the admin API expects on Calendar/Profile calls
+    API_HEADERS = {
+        'Accept': '*/*',
+        'Accept-Language': 'en-US,en;q=0.9',
+        # Brotli shrinks the Calendar JSON well beyond gzip, but is only
+        # advertised when urllib3 can decode it
+        'Accept-Encoding': 'br, gzip, deflate' if BROTLI_AVAILABLE else 'gzip, deflate',
+        'Origin': 'https://booking.gopichandacademy.com',
+        'Referer': 'https://booking.gopichandacademy.com/',
+        'Sec-Fetch-Dest': 'empty',
+        'Sec-Fetch-Mode': 'cors',
+        'Sec-Fetch-Site': 'same-site',
+        'Sec-GPC': '1',
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36',
+        'sec-ch-ua': '"Chromium";v="140", "Not=A?Brand";v="24", "Brave";v="140"',
+        'sec-ch-ua-mobile': '?0',
+        'sec-ch-ua-platform': '"Windows"'
+    }
+    
+    # Calendar requests in flight at once across all venues and dates
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # Shorter display names for the Telegram report
+    ACADEMY_SHORT_NAMES = {
+        "Kotak Pullela Gopichand Badminton Academy": "Kotak",
+        "Pullela Gopichand Badminton Academy": "Pullela",
+        "SAI Pullela Gopichand National Badminton Academy": "SAI",
+    }
+    
     def __init__(self):
         self.base_url = "https://booking.gopichandacademy.com"
         self.api_base = "https://adminbooking.gopichandacademy.com/API"  # Updated to actual API base!
@@ -37,9 +120,22 @@ class BadmintonAPIChecker:
             'Accept-Language': 'en-US,en;q=0.9',
             'Content-Type': 'application/json',
             'Origin': self.base_url,
-            'Referer': f'{self.base_url}/'
+            'Referer': f'{self.base_url}/',
+            'Connection': 'keep-alive'
         })
         
+        # Pooled keep-alive connections so the per-venue/date calls (made
+        # concurrently) reuse their TLS connections; transient gateway errors
+        # are retried with a short backoff. One pool per host (site + admin
+        # API), each sized for the calendar calls plus the token check that
+        # runs alongside them
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=self.MAX_CONCURRENT_REQUESTS + 1,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        
         # Academy mappings (from existing code)
         self.academies = {
             "Kotak Pullela Gopichand Badminton Academy": 1,
@@ -53,39 +149,37 @@ class BadmintonAPIChecker:
             # First try to load from API token file
             if os.path.exists(self.token_file):
                 logger.info("🔍 Loading API token from file...")
-                with open(self.token_file, 'r') as f:
-                    token_data = json.load(f)
-                    
+                token_data = read_json(self.token_file)
+                
                 # Check token age
-                token_age = datetime.now() - datetime.fromisoformat(token_data['timestamp'])
-                if token_age.total_seconds() < (7 * 24 * 3600):  # 7 days max
+                token_age = age_seconds(token_data['timestamp'])
+                if token_age < (7 * 24 * 3600):  # 7 days max
                     self.login_token = token_data['loginToken']
-                    logger.info(f"✅ Loaded API token (age: {token_age.total_seconds()/3600:.1f} hours)")
+                    logger.info(f"✅ Loaded API token (age: {token_age/3600:.1f} hours)")
                     return True
                 else:
-                    logger.info(f"⏰ API token too old ({token_age.total_seconds()/3600:.1f} hours)")
+                    logger.info(f"⏰ API token too old ({token_age/3600:.1f} hours)")
             
             # Fallback: try to load from browser session data
             session_file = "data/github_session.json"
             if os.path.exists(session_file):
                 logger.info("🔍 Loading token from browser session data...")
-                with open(session_file, 'r') as f:
-                    session_data = json.load(f)
-                    
+                session_data = read_json(session_file, backup=True)
+                
                 # Check session age
-                session_age = datetime.now() - datetime.fromisoformat(session_data['timestamp'])
-                if session_age.total_seconds() < (7 * 24 * 3600):  # 7 days max
+                session_age = age_seconds(session_data['timestamp'])
+                if session_age < (7 * 24 * 3600):  # 7 days max
                     login_token = session_data.get('local_storage', {}).get('loginToken')
                     if login_token:
                         self.login_token = login_token
-                        logger.info(f"✅ Loaded token from browser session (age: {session_age.total_seconds()/3600:.1f} hours)")
+                        logger.info(f"✅ Loaded token from browser session (age: {session_age/3600:.1f} hours)")
                         # Save to API token file for future use
                         self.save_token()
                         return True
                     else:
                         logger.warning("❌ No loginToken found in browser session")
                 else:
-                    logger.info(f"⏰ Browser session too old ({session_age.total_seconds()/3600:.1f} hours)")
+                    logger.info(f"⏰ Browser session too old ({session_age/3600:.1f} hours)")
             
             logger.info("❌ No valid tokens found")
             return False
@@ -104,13 +198,13 @@ class BadmintonAPIChecker:
             
             token_data = {
                 'loginToken': self.login_token,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.time(),
+                'timestamp_human': datetime.now().isoformat(),
                 'user_agent': self.user_agent
             }
             
-            with open(self.token_file, 'w') as f:
-                json.dump(token_data, f, indent=2)
-                
+            write_json(self.token_file, token_data)
+            
             logger.info("💾 API token saved successfully")
             
         except Exception as e:
@@ -140,30 +234,16 @@ class BadmintonAPIChecker:
             # Use the REAL profile endpoint to verify token
             endpoint = f"{self.api_base}/Customer/Data/Get/Profile"
             
-            headers = {
-                'Accept': '*/*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Connection': 'keep-alive',
-                'LoginToken': self.login_token,  # This is the key authentication method!
-                'Origin': 'https://booking.gopichandacademy.com',
-                'Referer': 'https://booking.gopichandacademy.com/',
-                'Sec-Fetch-Dest': 'empty',
-                'Sec-Fetch-Mode': 'cors',
-                'Sec-Fetch-Site': 'same-site',
-                'Sec-GPC': '1',
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36',
-                'sec-ch-ua': '"Chromium";v="140", "Not=A?Brand";v="24", "Brave";v="140"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"'
-            }
+            # LoginToken is the key authentication method!
+            headers = {**self.API_HEADERS, 'LoginToken': self.login_token}
             
             logger.info("🔐 Verifying login token using Profile API...")
             
-            response = self.session.get(endpoint, headers=headers, timeout=10)
+            response = await asyncio.to_thread(self.session.get, endpoint, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = loads_json(response.content)
                     if data.get('Status') == 'Success':
                         user_info = data.get('Result', {})
                         user_name = user_info.get('name', 'Unknown')
@@ -252,12 +332,7 @@ class BadmintonAPIChecker:
                     content = response.text.lower()
                     
                     # Look for signs that we're logged in
-                    logged_in_indicators = [
-                        'logout', 'profile', 'dashboard', 'booking', 'user',
-                        'login-token', 'logintoken'
-                    ]
-                    
-                    indicators_found = sum(1 for indicator in logged_in_indicators if indicator in content)
+                    indicators_found = sum(1 for indicator in self.LOGGED_IN_INDICATORS if indicator in content)
                     
                     if indicators_found >= 2:
                         logger.info(f"✅ Token appears valid based on main page content ({indicators_found} indicators)")
@@ -297,34 +372,20 @@ class BadmintonAPIChecker:
                 'date': date
             }
             
-            # Set up headers similar to the curl request
-            headers = {
-                'Accept': '*/*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Connection': 'keep-alive',
-                'Origin': 'https://booking.gopichandacademy.com',
-                'Referer': 'https://booking.gopichandacademy.com/',
-                'Sec-Fetch-Dest': 'empty',
-                'Sec-Fetch-Mode': 'cors',
-                'Sec-Fetch-Site': 'same-site',
-                'Sec-GPC': '1',
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/140.0.0.0 Safari/537.36',
-                'sec-ch-ua': '"Chromium";v="140", "Not=A?Brand";v="24", "Brave";v="140"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"'
-            }
-            
             logger.info(f"📡 Fetching slots for venue {venue_id} on {date} using REAL API...")
             logger.debug(f"🔗 URL: {endpoint}?venue_id={venue_id}&date={date}")
             
-            response = self.session.get(endpoint, params=params, headers=headers, timeout=15)
+            # requests is blocking - run it off the event loop so academies can be checked concurrently
+            response = await asyncio.to_thread(
+                self.session.get, endpoint, params=params, headers=self.API_HEADERS, timeout=15
+            )
             
             logger.debug(f"📊 Response: {response.status_code}")
             
             if response.status_code == 200:
                 try:
-                    data = response.json()
-                    logger.info(f"✅ Got API response: {len(str(data))} characters")
+                    data = loads_json(response.content)
+                    logger.info(f"✅ Got API response: {len(response.content)} bytes")
                     
                     # Parse the REAL response format
                     slots = self.parse_calendar_api_response(data, date)
@@ -390,32 +451,21 @@ class BadmintonAPIChecker:
                 available_slots = court_data.get('court_available_slots', [])
                 
                 # Parse available slots - format: "12:00-13:00|1|405"
-                # Where: time_slot|availability(1=available,0=booked)|price
-                available_times = []
-                all_time_slots = {}  # Store all slots with their availability status
-                total_available = 0
+                # Where: time_slot|availability(1=available,0=booked)|price.
+                # Malformed entries (fewer than 3 fields) are skipped
+                parsed = [
+                    parts for parts in (slot_str.split('|') for slot_str in available_slots
+                                        if isinstance(slot_str, str))
+                    if len(parts) >= 3
+                ]
                 
-                for slot_str in available_slots:
-                    try:
-                        parts = slot_str.split('|')
-                        if len(parts) >= 3:
-                            time_slot = parts[0]
-                            is_available = parts[1] == '1'
-                            price = parts[2]
-                            
-                            # Store all time slots with their status
-                            all_time_slots[time_slot] = {
-                                'available': is_available,
-                                'price': price
-                            }
-                            
-                            if is_available:
-                                available_times.append(time_slot)
-                                total_available += 1
-                                
-                    except Exception as e:
-                        logger.debug(f"Error parsing slot '{slot_str}': {e}")
-                        continue
+                # All slots with their availability status, plus the free ones
+                all_time_slots = {
+                    parts[0]: {'available': parts[1] == '1', 'price': parts[2]}
+                    for parts in parsed
+                }
+                available_times = [parts[0] for parts in parsed if parts[1] == '1']
+                total_available = len(available_times)
                 
                 # Create slot entry
                 slot_entry = {
@@ -431,7 +481,7 @@ class BadmintonAPIChecker:
                 }
                 
                 slots.append(slot_entry)
-                logger.debug(f"📊 Court {court_name}: {total_available} slots available")
+                logger.debug("📊 Court %s: %d slots available", court_name, total_available)
             
             logger.info(f"✅ Parsed {len(slots)} courts with total available slots")
             return slots
@@ -451,31 +501,13 @@ class BadmintonAPIChecker:
             # Simple HTML parsing to extract court/slot information
             # This is a basic implementation - could be enhanced with BeautifulSoup
             
-            import re
-            
-            # Look for patterns that might indicate court information
-            court_patterns = [
-                r'court["\s]*:[\s]*["\']([^"\']+)["\']',
-                r'court["\s]*["\']([^"\']+)["\']',
-                r'name["\s]*:[\s]*["\']([^"\']+)["\'].*court',
-            ]
-            
-            # Look for availability patterns
-            availability_patterns = [
-                r'available["\s]*:[\s]*(\d+)',
-                r'slots["\s]*:[\s]*(\d+)',
-                r'free["\s]*:[\s]*(\d+)',
-            ]
-            
             courts_found = []
-            for pattern in court_patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE)
-                courts_found.extend(matches)
+            for pattern in self.COURT_PATTERNS:
+                courts_found.extend(pattern.findall(html))
             
             availability_found = []
-            for pattern in availability_patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE)
-                availability_found.extend([int(m) for m in matches if m.isdigit()])
+            for pattern in self.AVAILABILITY_PATTERNS:
+                availability_found.extend([int(m) for m in pattern.findall(html) if m.isdigit()])
             
             # Try to match courts with availability
             for i, court in enumerate(courts_found[:len(availability_found)]):
@@ -522,9 +554,7 @@ class BadmintonAPIChecker:
                 logger.debug(f"📋 Response keys: {list(data.keys())[:10]}")  # First 10 keys
                 
                 # Look for common slot data structures
-                possible_slot_keys = ['slots', 'courts', 'bookings', 'availability', 'data', 'results']
-                
-                for key in possible_slot_keys:
+                for key in self.SLOT_DATA_KEYS:
                     if key in data:
                         logger.info(f"✅ Found potential slot data in '{key}' field")
                         slot_data = data[key]
@@ -570,23 +600,20 @@ class BadmintonAPIChecker:
             
             # Try to extract court/slot information
             # Common field names to look for
-            name_fields = ['name', 'court_name', 'title', 'court', 'venue']
-            for field in name_fields:
+            for field in self.NAME_FIELDS:
                 if field in item:
                     slot_info['court_name'] = str(item[field])
                     break
             
             # Look for availability information
-            availability_fields = ['available', 'availability', 'slots_available', 'free_slots']
-            for field in availability_fields:
+            for field in self.AVAILABILITY_FIELDS:
                 if field in item:
                     slot_info['available_slots'] = int(item[field]) if item[field] else 0
                     slot_info['available'] = slot_info['available_slots'] > 0
                     break
             
             # Look for total slots
-            total_fields = ['total', 'total_slots', 'capacity', 'max_slots']
-            for field in total_fields:
+            for field in self.TOTAL_FIELDS:
                 if field in item:
                     slot_info['total_slots'] = int(item[field]) if item[field] else 0
                     break
@@ -607,43 +634,67 @@ class BadmintonAPIChecker:
         Returns:
             Dictionary mapping academy names to their slot data
         """
+        # The public Calendar API doesn't need the token, so it is verified
+        # alongside the slot calls rather than before them
+        token_check = asyncio.create_task(self._report_token_status())
+        
+        logger.info(f"🏸 Checking {len(self.academies)} academies for {len(dates)} dates using API...")
+        
+        # Every (venue, date) call is independent - they all run at once, with
+        # the semaphore keeping the load on the server polite
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        academy_results = await asyncio.gather(
+            *(self._check_academy(academy_name, venue_id, dates, semaphore)
+              for academy_name, venue_id in self.academies.items()),
+            return_exceptions=True
+        )
+        await token_check
+        
         results = {}
+        for academy_name, academy_slots in zip(self.academies, academy_results):
+            if isinstance(academy_slots, Exception):
+                logger.error(f"❌ Error checking {academy_name}: {academy_slots}")
+                academy_slots = []
+            results[academy_name] = academy_slots
         
-        # Try to verify token if we have one (for authenticated APIs later)
+        return results
+    
+    async def _report_token_status(self):
+        """Verify the token if we have one (for authenticated APIs later) and log the outcome"""
         if self.login_token:
-            logger.info("� Verifying authentication token...")
+            logger.info("🔐 Verifying authentication token...")
             if await self.verify_token():
                 logger.info("✅ Token verified - can use authenticated APIs")
             else:
                 logger.warning("⚠️ Token verification failed - using public APIs only")
         else:
             logger.info("🔓 No token available - using public Calendar API")
+    
+    async def _check_academy(self, academy_name: str, venue_id: int, dates: List[str],
+                             semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Check one academy for every date at once and return its slots"""
+        logger.info(f"🏸 Checking: {academy_name} (ID: {venue_id})")
         
-        logger.info(f"🏸 Checking {len(self.academies)} academies for {len(dates)} dates using API...")
+        async def fetch(date):
+            async with semaphore:
+                logger.info(f"   📅 Checking {academy_name} on {date}")
+                return await self.get_venue_slots(venue_id, date)
         
-        for academy_name, venue_id in self.academies.items():
-            logger.info(f"🏸 Checking: {academy_name} (ID: {venue_id})")
-            academy_slots = []
-            
-            for date in dates:
-                logger.info(f"   📅 Checking {date}")
-                slots = await self.get_venue_slots(venue_id, date)
-                
-                if slots:
-                    academy_slots.extend(slots)
-                    available_count = sum(1 for slot in slots if slot['available'])
-                    logger.info(f"      ✅ Found {available_count} available slots")
-                else:
-                    logger.info(f"      ❌ No data received for {date}")
-                
-                # Small delay between requests to be respectful
-                await asyncio.sleep(1)
-            
-            results[academy_name] = academy_slots
-            total_available = sum(1 for slot in academy_slots if slot['available'])
-            logger.info(f"✅ {academy_name}: {total_available} total available slots")
+        academy_slots = []
+        total_available = 0
         
-        return results
+        # gather keeps the results in date order
+        for date, slots in zip(dates, await asyncio.gather(*(fetch(date) for date in dates))):
+            if slots:
+                academy_slots.extend(slots)
+                available_count = sum(1 for slot in slots if slot['available'])
+                total_available += available_count
+                logger.info(f"      ✅ {academy_name}: found {available_count} available slots on {date}")
+            else:
+                logger.info(f"      ❌ {academy_name}: no data received for {date}")
+        
+        logger.info(f"✅ {academy_name}: {total_available} total available slots")
+        return academy_slots
     
     def format_results_for_telegram(self, results: Dict[str, List[Dict]]) -> str:
         """
@@ -663,47 +714,31 @@ class BadmintonAPIChecker:
                     
                 # Create academy header
                 # Map to shorter display names for better readability
-                if "SAI Pullela Gopichand National Badminton Academy" in academy_name:
-                    short_name = "SAI"
-                elif "Kotak Pullela Gopichand Badminton Academy" in academy_name:
-                    short_name = "Kotak"
-                elif "Pullela Gopichand Badminton Academy" in academy_name:
-                    short_name = "Pullela"
-                else:
-                    short_name = academy_name
+                short_name = self.ACADEMY_SHORT_NAMES.get(academy_name, academy_name)
                 message_lines.append(f"\n📍 *{short_name}*")
                 
                 # Group by date
-                dates_data = {}
+                dates_data = defaultdict(list)
                 for slot in slots:
-                    date = slot['date']
-                    if date not in dates_data:
-                        dates_data[date] = []
-                    dates_data[date].append(slot)
+                    dates_data[slot['date']].append(slot)
                 
                 for date, date_slots in dates_data.items():
-                    # Format date
-                    try:
-                        date_obj = datetime.strptime(date, '%Y-%m-%d')
-                        formatted_date = date_obj.strftime('%a %b %d')
-                    except:
-                        formatted_date = date
-                    
-                    message_lines.append(f"  📅 {formatted_date}")
+                    message_lines.append(f"  📅 {format_date(date, '%a %b %d')}")
                     
-                    # Check if there are any available slots for this date
-                    date_has_available_slots = any(slot.get('available', False) for slot in date_slots)
+                    # One pass over the date's courts: is anything available, and
+                    # which time slots appear across all courts
+                    date_has_available_slots = False
+                    all_time_slots_set = set()
+                    for slot in date_slots:
+                        if slot.get('available', False):
+                            date_has_available_slots = True
+                        if 'all_time_slots' in slot:
+                            all_time_slots_set.update(slot['all_time_slots'])
                     
                     if not date_has_available_slots:
                         message_lines.append(f"    ❌ No slots available")
                         continue
                     
-                    # Collect all time slots from all courts for this date
-                    all_time_slots_set = set()
-                    for slot in date_slots:
-                        if 'all_time_slots' in slot:
-                            all_time_slots_set.update(slot['all_time_slots'].keys())
-                    
                     if not all_time_slots_set:
                         # Fallback to old format if no detailed data
                         for slot in date_slots:
@@ -713,17 +748,10 @@ class BadmintonAPIChecker:
                                 message_lines.append(f"    ✅ {court_name}: {available} slots")
                         continue
                     
-                    # Sort time slots (convert to 24h format for sorting)
-                    def time_sort_key(time_slot):
-                        try:
-                            # Extract start time from "12:00-13:00" format
-                            start_time = time_slot.split('-')[0]
-                            hour, minute = start_time.split(':')
-                            return int(hour) * 100 + int(minute)
-                        except:
-                            return 9999
-                    
-                    sorted_time_slots = sorted(all_time_slots_set, key=time_sort_key)
+                    # Keep the earliest time slots in order, limited to a
+                    # reasonable number of columns (Telegram width limit)
+                    max_columns = 8
+                    sorted_time_slots = heapq.nsmallest(max_columns, all_time_slots_set, key=_time_sort_key)
                     
                     # Create table header with time slots
                     # Use simple ASCII format for perfect monospace alignment
@@ -732,31 +760,17 @@ class BadmintonAPIChecker:
                             start_time = time_slot.split('-')[0]
                             hour = int(start_time.split(':')[0])
                             return f"{hour:02d}h"
-                        except:
+                        except (AttributeError, ValueError):
                             return time_slot[:2]
                     
                     time_headers = [format_time_for_header(slot) for slot in sorted_time_slots]
                     
-                    # Limit to reasonable number of columns (Telegram width limit)
-                    max_columns = 8
-                    if len(time_headers) > max_columns:
-                        time_headers = time_headers[:max_columns]
-                        sorted_time_slots = sorted_time_slots[:max_columns]
-                    
-                    # Create header row with precise alignment
-                    header = "```\n"
-                    # Standard 3-character offset to match court column (no extra spaces)
-                    header += "   "  # 3 character offset to match court column
-                    
-                    # Each time column is exactly 6 characters wide, center the time headers
-                    for h in time_headers:
-                        header += f"{h:^6}"
+                    # Create header row with precise alignment: a 3 character
+                    # offset to match the court column, then each time column
+                    # exactly 6 characters wide with the time header centered
+                    message_lines.append("```\n   " + "".join(f"{h:^6}" for h in time_headers) + "\n")
                     
-                    header += "\n"  # Single line break
-                    message_lines.append(header)
-                    
-                    # Create rows for each court
-                    court_rows = []
+                    # Create rows for each court, straight into the message
                     date_available_count = 0
                     
                     for slot in date_slots:
@@ -775,10 +789,6 @@ class BadmintonAPIChecker:
                             # Center symbol in fixed 6-character column
                             row += f"{symbol:^6}"
                         
-                        court_rows.append(row)
-                    
-                    # Add court rows
-                    for row in court_rows:
                         message_lines.append(row)
                     
                     message_lines.append("```")
@@ -0,0 +1,56 @@
+"""
+Shared Playwright browser pool
+Starts Playwright and Chromium once per process and hands out fresh contexts
+"""
+
+import logging
+
+from playwright.async_api import async_playwright
+
+logger = logging.getLogger(__name__)
+
+_playwright = None
+_browser = None
+
+
+async def get_playwright():
+    """Start Playwright on first use and return the shared driver"""
+    global _playwright
+    if _playwright is None:
+        _playwright = await async_playwright().start()
+    return _playwright
+
+
+async def get_browser(**launch_options):
+    """
+    Launch Chromium on first use and return the shared browser
+
+    launch_options only apply to the first launch (or a relaunch after the
+    browser disconnected).
+    """
+    global _browser
+    if _browser is None or not _browser.is_connected():
+        playwright = await get_playwright()
+        _browser = await playwright.chromium.launch(**launch_options)
+        logger.info("🌐 Launched shared Chromium browser")
+    return _browser
+
+
+async def new_context(launch_options=None, **context_options):
+    """Create a fresh context on the shared browser"""
+    browser = await get_browser(**(launch_options or {}))
+    return await browser.new_context(**context_options)
+
+
+async def close_browser_pool():
+    """Close the shared browser and stop Playwright if they were started"""
+    global _browser, _playwright
+    if _browser is not None:
+        try:
+            await _browser.close()
+        except Exception as e:
+            logger.debug(f"Error closing shared browser: {e}")
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
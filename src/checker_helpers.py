@@ -5,144 +5,355 @@ Contains helper functions and utilities for the main checker
 
 import os
 import json
+import time
+import asyncio
+import re
 import logging
+import functools
+import shutil
 import requests
-from datetime import datetime, timedelta, timezone
+from dotenv import dotenv_values
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def load_env_file():
-    """Load environment variables from .env file if it exists"""
+# IST is UTC+5:30
+IST_TIMEZONE = timezone(timedelta(hours=5, minutes=30))
+
+# Map day names to weekday numbers (Monday=0, Sunday=6)
+DAY_MAPPING = {
+    'monday': 0,
+    'tuesday': 1,
+    'wednesday': 2,
+    'thursday': 3,
+    'friday': 4,
+    'saturday': 5,
+    'sunday': 6
+}
+
+# Telegram table layout per academy short name, based on actual data
+# patterns: (court numbers, time slots, compact column labels)
+ACADEMY_TABLE_LAYOUTS = {
+    'Kotak': (
+        range(1, 7),  # Courts 1-6
+        ('12:00-13:00', '13:00-14:00', '18:00-19:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'),
+        ('12h', '13h', '18h', '19h', '20h', '21h'),
+    ),
+    'Pullela': (
+        range(1, 9),  # Courts 1-8
+        ('12:00-13:00', '13:00-14:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'),
+        ('12h', '13h', '19h', '20h', '21h'),
+    ),
+    'SAI': (
+        range(1, 10),  # Courts 1-9
+        ('12:00-13:00', '13:00-14:00', '18:00-19:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'),
+        ('12h', '13h', '18h', '19h', '20h', '21h'),
+    ),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _read_env_file(env_file):
+    """Parse a .env file once per process (values that are None are dropped)"""
+    return {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+
+
+def load_env_file(override=False):
+    """
+    Load environment variables from .env file if it exists
+
+    Variables already set in the environment win unless override is True.
+    Returns True if the file was found and loaded.
+    """
     env_file = Path(__file__).parent.parent / '.env'
     
-    if env_file.exists():
-        try:
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse KEY=VALUE format
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # Remove quotes if present
-                        if value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
-                        elif value.startswith("'") and value.endswith("'"):
-                            value = value[1:-1]
-                        
-                        # Set environment variable only if not already set
-                        if key not in os.environ:
-                            os.environ[key] = value
-        except Exception as e:
-            print(f"Warning: Could not load .env file: {e}")
+    if not env_file.exists():
+        return False
+    
+    try:
+        for key, value in _read_env_file(str(env_file)).items():
+            # Set environment variable only if not already set
+            if override or key not in os.environ:
+                os.environ[key] = value
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Could not load .env file: {e}")
+        return False
+
+
+def install_uvloop():
+    """Use uvloop for asyncio.run() when it is installed (not available on Windows)"""
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def loads_json(text):
+    """Parse JSON text or bytes (e.g. a page's JSON.stringify result or a response body), using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def age_seconds(timestamp):
+    """
+    Seconds elapsed since a saved timestamp
+
+    New saves store epoch seconds from time.time(); ISO strings written by
+    older versions are still accepted.
+    """
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp).timestamp()
+    return time.time() - timestamp
+
+
+def _read_json_file(path):
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def read_json(path, backup=False):
+    """
+    Read a JSON file, using orjson when it is installed
+
+    With backup=True an unreadable or invalid file falls back to the copy
+    write_json(..., backup=True) kept from the previous save.
+    """
+    try:
+        return _read_json_file(path)
+    except (OSError, ValueError) as e:
+        backup_path = f"{path}.bak"
+        if not backup or not os.path.exists(backup_path):
+            raise
+        logger.warning(f"⚠️ Could not read {path} ({e}) - using backup {backup_path}")
+        return _read_json_file(backup_path)
+
+
+def write_json(path, data, backup=False):
+    """
+    Write data to a JSON file, using orjson when it is installed
+
+    Output is compact unless DEBUG_MODE=true, since these files are only
+    read back by the checker itself. The data goes to a temp file that is
+    fsynced and renamed over path, so a run killed mid-write never leaves a
+    torn file. With backup=True the previous file is copied to path.bak
+    first; path itself is only ever replaced, never missing.
+    """
+    pretty = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
+    tmp_path = f"{path}.tmp"
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2 if pretty else None)
+            f.flush()
+            os.fsync(f.fileno())
+    if backup and os.path.exists(path):
+        shutil.copy2(path, f"{path}.bak")
+    os.replace(tmp_path, path)
+
+
+# Telegram rejects messages longer than this many characters
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# Shared HTTP session so every Telegram call reuses one pooled connection
+_telegram_session = None
+
+
+def get_telegram_session():
+    """Get the shared HTTP session used for Telegram API calls"""
+    global _telegram_session
+    if _telegram_session is None:
+        _telegram_session = requests.Session()
+    return _telegram_session
+
+
+def close_telegram_session():
+    """Close the shared Telegram HTTP session if one was opened"""
+    global _telegram_session
+    if _telegram_session is not None:
+        _telegram_session.close()
+        _telegram_session = None
+
+
+def split_telegram_message(message, limit=TELEGRAM_MESSAGE_LIMIT):
+    """
+    Split a message on line boundaries into chunks Telegram accepts
+
+    A code block left open at a chunk boundary is closed and reopened in
+    the next chunk so the slot tables still render as Markdown.
+    """
+    if len(message) <= limit:
+        return [message]
+    
+    fence = "```"
+    # Leave room for a closing fence and its newline
+    max_line = limit - len(fence) - 1
+    
+    chunks = []
+    current = []
+    current_len = 0
+    in_fence = False
+    
+    for line in message.split('\n'):
+        # Hard-split lines that could never fit in a single chunk
+        pieces = [line[i:i + max_line] for i in range(0, len(line), max_line)] or ['']
+        
+        for piece in pieces:
+            if current and current_len + len(piece) + 1 > max_line:
+                if in_fence:
+                    current.append(fence)
+                chunks.append('\n'.join(current))
+                current = [fence] if in_fence else []
+                current_len = sum(len(part) + 1 for part in current)
+            
+            current.append(piece)
+            current_len += len(piece) + 1
+        
+        if line.strip() == fence:
+            in_fence = not in_fence
+    
+    if current:
+        chunks.append('\n'.join(current))
+    
+    return chunks
 
 
 def send_telegram_message(telegram_token, chat_id, message):
-    """Send message to Telegram"""
+    """Send message to Telegram, splitting it only if it exceeds the size limit"""
     try:
         url = f"https://api.telegram.org/bot{telegram_token}/sendMessage"
-        data = {
-            'chat_id': chat_id,
-            'text': message,
-            'parse_mode': 'Markdown'
-        }
+        session = get_telegram_session()
         
-        response = requests.post(url, data=data)
-        result = response.json()
+        for chunk in split_telegram_message(message):
+            data = {
+                'chat_id': chat_id,
+                'text': chunk,
+                'parse_mode': 'Markdown'
+            }
+            
+            response = session.post(url, data=data)
+            result = response.json()
+            
+            if not result.get('ok'):
+                logger.error(f"❌ Telegram API error: {result}")
+                return False
         
-        if result.get('ok'):
-            logger.info("✅ Telegram message sent successfully")
-            return True
-        else:
-            logger.error(f"❌ Telegram API error: {result}")
-            return False
+        logger.info("✅ Telegram message sent successfully")
+        return True
             
     except Exception as e:
         logger.error(f"❌ Error sending Telegram message: {e}")
         return False
 
 
-def get_check_dates():
-    """Get dates to check based on configuration settings (in IST timezone)"""
-    # Use IST timezone for date calculations
-    ist_timezone = timezone(timedelta(hours=5, minutes=30))
-    today = datetime.now(ist_timezone)
+async def send_telegram_message_async(telegram_token, chat_id, message):
+    """Send a Telegram message from a worker thread so the event loop keeps running"""
+    return await asyncio.to_thread(send_telegram_message, telegram_token, chat_id, message)
+
+
+@functools.lru_cache(maxsize=64)
+def format_date(iso_date, fmt):
+    """
+    Format a YYYY-MM-DD string with strftime, memoized per (date, format)
+
+    Reports format the same few dates once per academy, so each pair is
+    parsed and formatted only once. Unparsable input is returned unchanged.
+    """
+    try:
+        return date.fromisoformat(iso_date).strftime(fmt)
+    except (TypeError, ValueError):
+        return iso_date
+
+
+@functools.lru_cache(maxsize=2)
+def _upcoming_dates(today_ordinal, enabled_days):
+    """
+    Next occurrence of each enabled weekday, memoized per calendar day
+
+    Returns a tuple of (day_name, 'YYYY-MM-DD', display) sorted by date.
+    """
+    today = date.fromordinal(today_ordinal)
+    day_names = {num: name for name, num in DAY_MAPPING.items()}
     
-    # Load configuration
+    upcoming = []
+    for target_day in enabled_days:
+        # Calculate days until target day
+        days_until = (target_day - today.weekday()) % 7
+        if days_until == 0:  # Today is the target day
+            days_until = 7  # Get next occurrence instead
+        
+        next_date = today + timedelta(days=days_until)
+        upcoming.append((
+            day_names.get(target_day, str(target_day)),
+            next_date.isoformat(),
+            next_date.strftime('%a %b %d')
+        ))
+    
+    # Sort by date to maintain consistent order
+    return tuple(sorted(upcoming, key=lambda entry: entry[1]))
+
+
+@functools.lru_cache(maxsize=1)
+def load_settings():
+    """
+    Load config/settings.json, returning an empty dict if it can't be read
+
+    The result is cached for the life of the process; treat it as read-only.
+    """
     config_path = Path(__file__).parent.parent / 'config' / 'settings.json'
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-            check_days = config.get('check_days', {
-                'monday': True,
-                'tuesday': False, 
-                'wednesday': False,
-                'thursday': False,
-                'friday': True,
-                'saturday': False,
-                'sunday': False
-            })
+        return read_json(config_path)
     except Exception as e:
         logger.warning(f"⚠️ Could not load config, using defaults: {e}")
-        # Default to Friday and Monday
-        check_days = {
-            'monday': True,
-            'tuesday': False,
-            'wednesday': False, 
-            'thursday': False,
-            'friday': True,
-            'saturday': False,
-            'sunday': False
-        }
+        return {}
+
+
+def get_check_dates(now=None):
+    """Get dates to check based on configuration settings (in IST timezone)"""
+    # Use IST timezone for date calculations
+    today = now or datetime.now(IST_TIMEZONE)
     
-    # Map day names to weekday numbers (Monday=0, Sunday=6)
-    day_mapping = {
-        'monday': 0,
-        'tuesday': 1,
-        'wednesday': 2,
-        'thursday': 3,
-        'friday': 4,
-        'saturday': 5,
-        'sunday': 6
-    }
+    # Load configuration - default to Friday and Monday
+    check_days = load_settings().get('check_days', {
+        'monday': True,
+        'tuesday': False, 
+        'wednesday': False,
+        'thursday': False,
+        'friday': True,
+        'saturday': False,
+        'sunday': False
+    })
     
     # Find enabled days
-    enabled_days = [day_mapping[day] for day, enabled in check_days.items() if enabled]
+    enabled_days = tuple(DAY_MAPPING[day] for day, enabled in check_days.items() if enabled)
     
     if not enabled_days:
         logger.warning("⚠️ No days enabled in config, defaulting to Friday and Monday")
-        enabled_days = [4, 0]  # Friday and Monday
-    
-    # Calculate next occurrence of each enabled day
-    upcoming_dates = {}
+        enabled_days = (4, 0)  # Friday and Monday
     
-    for target_day in enabled_days:
-        # Calculate days until target day
-        days_until = (target_day - today.weekday()) % 7
-        if days_until == 0:  # Today is the target day
-            days_until = 7  # Get next occurrence instead
-        
-        next_date = today + timedelta(days=days_until)
-        
-        # Convert weekday number back to day name
-        day_name = next((name for name, num in day_mapping.items() if num == target_day), str(target_day))
-        
-        upcoming_dates[day_name] = {
-            'date': next_date.strftime('%Y-%m-%d'),
-            'display': next_date.strftime('%a %b %d')
-        }
-    
-    # Sort by date to maintain consistent order
-    sorted_dates = dict(sorted(upcoming_dates.items(), key=lambda x: x[1]['date']))
+    # Dates only change once a day, so the calculation is cached per day
+    sorted_dates = {
+        day_name: {'date': date_str, 'display': display}
+        for day_name, date_str, display in _upcoming_dates(today.toordinal(), enabled_days)
+    }
     
     # Log what days we're checking
     display_names = [info['display'] for info in sorted_dates.values()]
@@ -151,6 +362,89 @@ def get_check_dates():
     return sorted_dates
 
 
+# A clock time in a slot label: "12:00", "7:00 PM", "19:00hrs"
+_SLOT_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*([ap]\.?m\.?)?', re.IGNORECASE)
+
+
+def normalize_slot_time(time_slot):
+    """Normalise a slot label to "HH:MM-HH:MM" (24h); unrecognised labels are returned stripped"""
+    times = []
+    for hour, minute, meridiem in _SLOT_TIME_RE.findall(time_slot)[:2]:
+        hour = int(hour)
+        if meridiem:
+            hour = hour % 12 + (12 if meridiem[0].lower() == 'p' else 0)
+        times.append(f"{hour:02d}:{minute}")
+    return '-'.join(times) if times else time_slot.strip()
+
+
+def court_number(court):
+    """Court number from a label like "Court 1" or "1" (as a string), else the stripped label"""
+    court = str(court)
+    digits = ''.join(filter(str.isdigit, court))
+    return str(int(digits)) if digits else court.strip()
+
+
+def seen_slot_key(academy_short, slot_date, court, time_slot):
+    """
+    Dedup key for one available slot: (academy short name, date, court number, "HH:MM-HH:MM")
+
+    The API and browser paths label courts and times differently ("1" vs
+    "Court 1", "12:00-13:00" vs "12:00 - 13:00"), so both build their keys
+    here and a switch between them does not re-report every open slot.
+    """
+    return (academy_short, slot_date, court_number(court), normalize_slot_time(str(time_slot)))
+
+
+def _seen_slot_name(key):
+    """Seen-file entry name for a seen_slot_key tuple"""
+    return '|'.join(map(str, key))
+
+
+def read_seen_slots(seen_file):
+    """Load the seen-slots file as {name: first-seen timestamp}, empty if missing or unreadable"""
+    seen_file = Path(seen_file)
+    if not seen_file.exists():
+        return {}
+    try:
+        return read_json(seen_file)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read seen slots, treating all as new: {e}")
+        return {}
+
+
+def diff_new_slots(slot_keys, seen):
+    """
+    Return the slot_keys that are not in seen (as loaded by read_seen_slots)
+
+    slot_keys are seen_slot_key tuples for every slot that is available now.
+    Nothing is written - see commit_seen_slots.
+    """
+    new_slots = [key for key in slot_keys if _seen_slot_name(key) not in seen]
+    logger.info(f"🔁 {len(new_slots)} new of {len(slot_keys)} available slots since last run")
+    return new_slots
+
+
+def commit_seen_slots(seen_file, slot_keys, seen):
+    """
+    Replace the seen-slots file with exactly slot_keys
+
+    Call this only once the notification went out, so slots are never marked
+    as seen without having been reported. Slots that get booked (or whose
+    date passes) drop out and will be reported again if they open up later.
+    """
+    seen_file = Path(seen_file)
+    now = datetime.now().timestamp()
+    try:
+        seen_file.parent.mkdir(exist_ok=True)
+        # Keep the first-seen time for slots that are still open
+        write_json(seen_file, {
+            name: seen.get(name, now)
+            for name in map(_seen_slot_name, slot_keys)
+        })
+    except Exception as e:
+        logger.warning(f"⚠️ Could not save seen slots: {e}")
+
+
 def format_results_message(all_slots, dates):
     """Format the results into a beautiful Telegram message"""
     try:
@@ -194,9 +488,7 @@ def format_results_message(all_slots, dates):
         env_indicator = "🤖 *GitHub Actions*" if is_github_actions else "💻 *Local Run*"
         
         # Add timestamp with IST timezone
-        from datetime import timezone
-        ist_timezone = timezone(timedelta(hours=5, minutes=30))  # IST is UTC+5:30
-        current_time_ist = datetime.now(ist_timezone).strftime('%H:%M')
+        current_time_ist = datetime.now(IST_TIMEZONE).strftime('%H:%M')
         
         message += f"\n\n⚡ *Via API* - {current_time_ist} IST - {env_indicator}"
         message += "\n🔗 [Book Now](https://booking.gopichandacademy.com/)"
@@ -210,55 +502,27 @@ def format_results_message(all_slots, dates):
 
 def create_academy_table(academy_short, academy_slots):
     """Create a compact table format for an academy's available slots"""
-    # Define academy-specific configurations based on actual data patterns
-    academy_configs = {
-        'Kotak': {
-            'courts': list(range(1, 7)),  # Courts 1-6
-            'time_slots': ['12:00-13:00', '13:00-14:00', '18:00-19:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'],
-            'time_labels': ['12h', '13h', '18h', '19h', '20h', '21h']  # Compact labels
-        },
-        'Pullela': {
-            'courts': list(range(1, 9)),  # Courts 1-8 
-            'time_slots': ['12:00-13:00', '13:00-14:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'],
-            'time_labels': ['12h', '13h', '19h', '20h', '21h']
-        },
-        'SAI': {
-            'courts': list(range(1, 10)),  # Courts 1-9
-            'time_slots': ['12:00-13:00', '13:00-14:00', '18:00-19:00', '19:00-20:00', '20:00-21:00', '21:00-22:00'],
-            'time_labels': ['12h', '13h', '18h', '19h', '20h', '21h']
-        }
-    }
-    
-    config = academy_configs.get(academy_short, academy_configs['SAI'])  # Default to SAI config
+    courts, time_slots, time_labels = ACADEMY_TABLE_LAYOUTS.get(academy_short, ACADEMY_TABLE_LAYOUTS['SAI'])  # Default to SAI layout
     
-    # Create availability matrix - check all dates
-    availability_matrix = {}
-    for court in config['courts']:
-        availability_matrix[court] = {}
-        for time_slot in config['time_slots']:
-            availability_matrix[court][time_slot] = False  # Default: not available
-    
-    # Mark available slots from API data
-    for date, date_data in academy_slots.items():
-        for slot in date_data.get('available', []):
-            court = slot.get('court_number')
-            time_range = slot.get('time')
-            
-            if court in availability_matrix and time_range in availability_matrix[court]:
-                availability_matrix[court][time_range] = True
+    # Collect available (court, time) pairs across all dates in one pass
+    available = {
+        (slot.get('court_number'), slot.get('time'))
+        for date_data in academy_slots.values()
+        for slot in date_data.get('available', [])
+    }
     
     # Build ASCII table
     lines = []
     
     # Header row with time labels
-    header = "```\n   " + " ".join(f"{label:>3}" for label in config['time_labels'])
+    header = "```\n   " + " ".join(f"{label:>3}" for label in time_labels)
     lines.append(header)
     
     # Court rows
-    for court in config['courts']:
+    for court in courts:
         row_data = []
-        for time_slot in config['time_slots']:
-            if availability_matrix[court][time_slot]:
+        for time_slot in time_slots:
+            if (court, time_slot) in available:
                 row_data.append(" ✓ ")  # Available (with padding for alignment)
             else:
                 row_data.append(" • ")  # Not available (with padding for alignment)